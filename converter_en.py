@@ -7,24 +7,320 @@ Production-ready tool with data integrity verification and backup system
 Features:
 - Data integrity verification between PHP and JSON
 - Automatic backup system before any file operations
-- Deep comparison and validation of converted data
-- Auto-retry mechanism for failed conversions
+- Deep comparison and validation of converted data (--full-verify)
 - Enterprise-grade logging and audit trails
 - Rollback capability for safety
 - Production-level error handling
 """
 
 import os
+import argparse
 import re
 import json
+import logging
+import logging.handlers
+import mmap
+import hashlib
 import sys
 import time
 import shutil
+import subprocess
+import functools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Pattern
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster JSON encoding when installed
+except ImportError:
+    orjson = None
+
+# Credit banner - assembled once at import and written to stdout in one call
+_CREDIT_BANNER = '\n'.join((
+    "\n" + "═" * 70,
+    "╔" + "═" * 68 + "╗",
+    "║" + " " * 68 + "║",
+    "║" + "   ██████╗ ██╗  ██╗██████╗ ██████╗      ██╗███████╗ ██████╗ ███╗   ██╗".center(68) + "║",
+    "║" + "   ██╔══██╗██║  ██║██╔══██╗╚════██╗     ██║██╔════╝██╔═══██╗████╗  ██║".center(68) + "║",
+    "║" + "   ██████╔╝███████║██████╔╝ █████╔╝     ██║███████╗██║   ██║██╔██╗ ██║".center(68) + "║",
+    "║" + "   ██╔═══╝ ██╔══██║██╔═══╝ ██╔═══╝ ██   ██║╚════██║██║   ██║██║╚██╗██║".center(68) + "║",
+    "║" + "   ██║     ██║  ██║██║     ███████╗╚█████╔╝███████║╚██████╔╝██║ ╚████║".center(68) + "║",
+    "║" + "   ╚═╝     ╚═╝  ╚═╝╚═╝     ╚══════╝ ╚════╝ ╚══════╝ ╚═════╝ ╚═╝  ╚═══╝".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "🚀 ENTERPRISE PHP TO JSON LANGUAGE CONVERTER 🚀".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "🎯 CREATED BY: KÊNH TÁO".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "📱 TELEGRAM: @QTUNUy".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "🌐 WEBSITES:".center(68) + "║",
+    "║" + "• CertApple.com  • Kenhtao.net  • kenhtao.site  • iPA.KenhTao.net".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "💝 Thank you for using PHP2JSON Enterprise Converter! 💝".center(68) + "║",
+    "║" + "⭐ If this tool helped you, please star our GitHub repository ⭐".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "║" + "🔔 For updates and support, follow us on Telegram: @QTUNUy 🔔".center(68) + "║",
+    "║" + " " * 68 + "║",
+    "╚" + "═" * 68 + "╝",
+    "═" * 70,
+)) + '\n'
+
+# Log timestamps - formatted once per second instead of once per record
+class _SecondCachedFormatter(logging.Formatter):
+    """Log formatter that renders each distinct timestamp second only once"""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._cached_time = (second, formatted)
+        return formatted
+
+# String value cleaning for the fallback parsers - module-level so _clean_string_value can be
+# memoized without holding a reference to a converter instance
+_RE_VALUE_ESCAPE = re.compile(r'\\([\\"\'nrt])')
+_VALUE_ESCAPES = {'\\': '\\', '"': '"', "'": "'", 'n': '\n', 'r': '\r', 't': '\t'}
+
+_RE_QUOTED_HTML_OPEN = re.compile(r'"\s*<([^>]+)>\s*"')
+_RE_QUOTED_HTML_CLOSE = re.compile(r'"\s*</([^>]+)>\s*"')
+_RE_QUOTED_WORD = re.compile(r'\b"(\w+)"\b')
+_RE_DOUBLED_DQUOTES = re.compile(r'""([^"]*?)""')
+_RE_DOUBLED_SQUOTES = re.compile(r"''([^']*?)''")
+_RE_DOUBLED_ATTR_QUOTES = re.compile(r'([a-zA-Z-]+)=""([^"]*?)""')
+_RE_SPACED_DQUOTE = re.compile(r'(\w)\s*"\s*(\w)')
+_RE_SPACED_SQUOTE = re.compile(r'(\w)\s*\'\s*(\w)')
+_RE_INNER_DQUOTE = re.compile(r'(\w)"(\w)')
+_RE_INNER_SQUOTE = re.compile(r"(\w)'(\w)")
+
+def _replace_value_escape(match) -> str:
+    """Replacement callback for escape sequences in fallback string values"""
+    return _VALUE_ESCAPES[match.group(1)]
+
+# Language files repeat many values (OK, Cancel...) within and across files; the result depends
+# only on the value
+@functools.lru_cache(maxsize=65536)
+def _clean_string_value(value: str) -> str:
+    """Enhanced string value cleaning with advanced quote handling"""
+    if not value:
+        return value
+
+    # Step 1: Handle PHP escape sequences first - one left-to-right pass, so an escaped
+    # backslash is never re-read as the start of another escape
+    if '\\' in value:
+        value = _RE_VALUE_ESCAPE.sub(_replace_value_escape, value)
+
+    # Step 2: Remove surrounding quotes if they're doubled up
+    value = value.strip()
+    if (value.startswith('""') and value.endswith('""') and len(value) > 4):
+        value = value[2:-2]
+    elif (value.startswith("''") and value.endswith("''") and len(value) > 4):
+        value = value[2:-2]
+
+    # Steps 3-8 only rewrite quote characters; most values have none
+    if '"' not in value and "'" not in value:
+        return value
+
+    # Step 3: Fix nested quote issues
+    # Remove extra quotes around HTML content
+    value = _RE_QUOTED_HTML_OPEN.sub(r'<\1>', value)
+    value = _RE_QUOTED_HTML_CLOSE.sub(r'</\1>', value)
+
+    # Step 4: Clean up quote patterns that shouldn't be there
+    # Remove quotes around single words that don't need them
+    value = _RE_QUOTED_WORD.sub(r'\1', value)
+
+    # Step 5: Fix common quote doubling patterns
+    value = _RE_DOUBLED_DQUOTES.sub(r'"\1"', value)
+    value = _RE_DOUBLED_SQUOTES.sub(r"'\1'", value)
+
+    # Step 6: Clean up extra quotes in HTML attributes
+    value = _RE_DOUBLED_ATTR_QUOTES.sub(r'\1="\2"', value)
+
+    # Step 7: Remove quotes that appear at word boundaries inappropriately
+    value = _RE_SPACED_DQUOTE.sub(r'\1 \2', value)
+    value = _RE_SPACED_SQUOTE.sub(r'\1 \2', value)
+
+    # Step 8: Final cleanup - remove any remaining double quotes that are clearly errors
+    # Look for patterns like: word"word or word'word
+    value = _RE_INNER_DQUOTE.sub(r'\1\2', value)
+    value = _RE_INNER_SQUOTE.sub(r'\1\2', value)
+
+    return value
+
 class EnterprisePHPToJSONConverter:
+    # Precompiled regex patterns - compiled once at class load and shared by every file
+    # PHP keywords are case-insensitive, so only they are wrapped in a scoped (?i:...) group;
+    # the rest of each pattern (strings, brackets, whitespace) matches case-sensitively
+    # File analysis
+    _RE_RETURN_STMT = re.compile(r'\b(?i:return)\s+')
+    _RE_VAR_ASSIGN = re.compile(r'\$\w+\s*=')
+    _RE_ARRAY_SYNTAX = re.compile(r'(?P<short_array>\[)|(?P<long_array>(?i:array)\s*\()')
+    _RE_VAR_NAME = re.compile(r'\$(\w+)\s*=')
+
+    # Primary parser: single-pass PHP tokenizer (the catch-all keeps tokens contiguous)
+    _RE_PHP_TOKEN = re.compile(r"""
+        (?P<skip>\s+|//[^\n]*|\#[^\n]*|/\*.*?\*/|<\?php|<\?=?|\?>)        # Whitespace, comments, PHP tags
+        | (?P<string>'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*")  # Quoted string
+        | (?P<heredoc><<<[ \t]*(?P<hd_quote>["']?)(?P<hd_label>[A-Za-z_]\w*)(?P=hd_quote)\n(?:(?P<hd_body>.*?)\n)??(?P<hd_indent>[ \t]*)(?P=hd_label)\b)  # Heredoc / nowdoc
+        | (?P<number>-?(?:0[xX][0-9a-fA-F]+(?:_[0-9a-fA-F]+)*            # Integer or float: hex, binary, octal, decimal, _ separators
+            | 0[bB][01]+(?:_[01]+)* | 0[oO][0-7]+(?:_[0-7]+)*
+            | (?:\d+(?:_\d+)*(?:\.(?:\d+(?:_\d+)*)?)? | \.\d+(?:_\d+)*)(?:[eE][+-]?\d+(?:_\d+)*)?))
+        | (?P<arrow>=>)                                                  # Key-value arrow
+        | (?P<variable>\$\w+)                                            # Variable
+        | (?P<name>[A-Za-z_]\w*)                                         # Keyword or constant
+        | (?P<op>[\[\](),;=.])                                           # Punctuation
+        | (?P<other>.)                                                   # Anything else
+    """, re.VERBOSE | re.DOTALL)
+    _RE_SQ_ESCAPE = re.compile(r"\\([\\'])")
+    _RE_DQ_ESCAPE = re.compile(r'\\(?:([ntrvef\\$"])|([0-7]{1,3})|x([0-9A-Fa-f]{1,2})|u\{([0-9A-Fa-f]+)\})')
+    # Heredoc bodies use the same escapes except \", which stays a backslash and a quote
+    _RE_HEREDOC_ESCAPE = re.compile(r'\\(?:([ntrvef\\$])|([0-7]{1,3})|x([0-9A-Fa-f]{1,2})|u\{([0-9A-Fa-f]+)\})')
+    _RE_PHP_INT_KEY = re.compile(r'-?[1-9]\d*|0')
+    _PHP_DQ_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'v': '\v', 'e': '\x1b', 'f': '\f', '\\': '\\', '$': '$', '"': '"'}
+    _PHP_INT_MAX = 2 ** 63 - 1
+
+    # PHP content cleaning: open/close tags and //, /* */, # comments removed in one leftmost-first pass.
+    # Quoted strings are matched too and substituted back unchanged, so markers inside them (URLs,
+    # '#' colours) survive
+    _RE_PHP_NOISE = re.compile(
+        r'''(?P<string>'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*")'''
+        r'|<\?php\s*|\?>|//[^\n]*|/\*.*?\*/|#[^\n]*',
+        re.DOTALL
+    )
+
+    # Strategy 1: array body extraction - one lookahead alternation (overlapping
+    # matches, so no form hides another) scanned once; when several forms
+    # are present the earlier entry in _ARRAY_BODY_PRIORITY wins, as with separate searches
+    _RE_ARRAY_BODY = re.compile(
+        r'(?=(?i:return)\s*(?:\[\s*(?P<return_short>.*?)\s*\];|(?i:array)\s*\(\s*(?P<return_long>.*?)\s*\);)'
+        r'|\$(?i:lang|language|data|translations|messages|text|strings)\s*=\s*'
+        r'(?:\[\s*(?P<var_short>.*?)\s*\];|(?i:array)\s*\(\s*(?P<var_long>.*?)\s*\);))',
+        re.DOTALL
+    )
+    _ARRAY_BODY_PRIORITY = ('return_short', 'return_long', 'var_short', 'var_long')
+
+    # Strategy 2: array start detection and key-value tokenizer
+    _RE_ARRAY_START_PATTERNS = (
+        re.compile(r'(?i:return)\s*\['),
+        re.compile(r'(?i:return)\s*(?i:array)\s*\('),
+        re.compile(r'\$\w+\s*=\s*\['),
+        re.compile(r'\$\w+\s*=\s*(?i:array)\s*\('),
+    )
+
+    # Fallback dispatch: any array opener that strategies 1 and 2 can anchor on
+    _RE_ARRAY_PREAMBLE = re.compile(r'(?:(?i:return)|\$\w+\s*=)\s*(?:\[|(?i:array)\s*\()')
+
+    # Python's re has no recursive groups, so nested arrays are matched one level deep.
+    # Quoted strings use the unrolled-loop form [^q\\]*(?:\\.[^q\\]*)*: every character
+    # can only be consumed one way, so a failed match never backtracks exponentially.
+    _RE_KV_TOKENIZER = re.compile(r"""
+        (?:^|,|\n)\s*                                           # Start or separator
+        (['\"])([^'"\\]*(?:(?:\\.|(?!\1)['"])[^'"\\]*)*)\1      # Quoted key
+        \s*=>\s*                                                # Arrow
+        (?:
+            (['\"])([^'"\\]*(?:(?:\\.|(?!\3)['"])[^'"\\]*)*)\3  # Quoted value
+            |
+            (\d+(?:\.\d+)?)                                     # Number
+            |
+            ((?i:true|false|null))                              # Boolean/null
+            |
+            (\[(?:[^\[\]]|\[[^\[\]]*\])*\])                     # Simple nested array
+        )
+    """, re.VERBOSE | re.DOTALL)
+
+    # Strategy 3: line-by-line state machine
+    _RE_ARRAY_OPENER_LINE = re.compile(r'return\s*[\[\(]|^\$\w+\s*=\s*[\[\(]')
+    _RE_QUOTED_SIMPLE = re.compile(r"['\"]([^'\"]*)['\"]")
+
+    # Strategy 4: manual nested handling
+    _RE_KV_MANUAL = re.compile(r"""
+        (['\"])([^'"\\]*(?:(?:\\.|(?!\1)['"])[^'"\\]*)*)\1      # Key in quotes
+        \s*=>\s*                                                # Arrow
+        (?:
+            (['\"])([^'"\\]*(?:(?:\\.|(?!\3)['"])[^'"\\]*)*)\3  # Simple quoted value
+            |
+            (\d+(?:\.\d+)?)                                     # Numeric value
+            |
+            ((?i:true|false|null))                              # Boolean/null
+            |
+            (\[(?:[^\[\]]|\[[^\[\]]*\])*\])                     # Nested array (one level)
+        )
+    """, re.VERBOSE | re.DOTALL)
+
+    # Advanced array content parsing - no letters in these patterns, so no IGNORECASE
+    _RE_KV_ADVANCED = re.compile(r'''
+        (?:^|,|\n)\s*                           # Start or separator with whitespace
+        ([\'"])((?:\\.|(?!\1)[^\\])*?)\1        # Quoted key with escape handling
+        \s*=>\s*                                # Arrow with optional whitespace
+        ([\'"])((?:\\.|[^\\])*?)\3              # Quoted string value with better handling
+        (?=\s*(?:,|\n|$|\]))                    # Lookahead for end
+    ''', re.VERBOSE | re.DOTALL)
+
+    _RE_KV_ADVANCED_ALT = re.compile(r'''
+        (?:^|,|\n)\s*                           # Start or separator
+        ([\'"])((?:[^\'"]|\\[\'"])*?)\1         # Key with escaped quotes
+        \s*=>\s*                                # Arrow
+        ([\'"])                                 # Opening value quote
+        ((?:                                    # Value content
+            [^\'\"\\]|                          # Normal characters
+            \\.|                                # Escaped characters
+            [\'"](?![\'"])                      # Single quotes not at boundary
+        )*?)
+        \3                                      # Closing value quote
+        (?=\s*(?:,|\n|$|\]))                    # End boundary
+    ''', re.VERBOSE | re.DOTALL)
+
+    # Line-by-line fallback: only lines containing '=>' are visited
+    _RE_FALLBACK_LINE = re.compile(r'^.*=>.*$', re.MULTILINE)
+    _RE_FALLBACK_KEY = re.compile(r'''(['"])((?:[^'"\\]|\\.)*)?\1''')
+    _RE_FALLBACK_VALUE = re.compile(r'''(['"])((?:[^'"\\]|\\.|["'][^"']*["'])*)?\1''')
+
+    # Native PHP evaluation: buffer any output, then echo the included array as JSON
+    _PHP_JSON_SCRIPT = (
+        'ob_start(); $data = include $argv[1]; ob_end_clean(); '
+        'echo json_encode($data, JSON_PRESERVE_ZERO_FRACTION | JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_SLASHES);'
+    )
+
+    # Files larger than this are memory-mapped rather than read into a bytes copy
+    _MMAP_THRESHOLD = 64 * 1024
+
+    # Progress output: per-file status lines are written to stdout in batches of this many files
+    _STATUS_FLUSH_INTERVAL = 256
+
+    # Validation: more keys than this in one file is treated as a runaway parse; real language
+    # files can exceed ten thousand entries
+    _MAX_KEYS = 100000
+
+    # Parse cache: entries are keyed by this version and the parsing backend as well as the file
+    # content - bump it whenever a parser change alters output, so stale results are never reused
+    _PARSER_VERSION = 4
+
+    # File discovery: directories never descended into - VCS/tooling metadata and this tool's own
+    # logs, cache and timestamped backups (re-scanning a backup would convert the copies)
+    _SKIP_DIR_NAMES = frozenset({".git", ".hg", ".svn", "node_modules", ".venv", "__pycache__", ".idea",
+                                 "conversion_logs", ".converter_cache"})
+    _RE_BACKUP_DIR = re.compile(r'backup_\d{8}_\d{6}')
+
+    # File discovery: names that are never treated as language files
+    _SKIP_FILE_NAMES = frozenset({"converter_en.py", "converter_vi.py", "load_json_example.php"})
+
+    # Log line format shared by every log stream
+    _LOG_FORMATTER = _SecondCachedFormatter('[%(asctime)s] %(tag)s: %(message)s', '%Y-%m-%d %H:%M:%S')
+
+    # Log records are held in memory and written in one batch per file (or when this many pile up)
+    _LOG_BUFFER_RECORDS = 256
+
     def __init__(self):
         self.root_dir = Path.cwd()
         self.php_files = []
@@ -34,13 +330,28 @@ class EnterprisePHPToJSONConverter:
         self.failed_files = []
         self.verified_files = []
         self.backup_dir = None
-        self.processing_delay = 0.1
-        self.max_retries = 3
+        self.processing_delay = 0.0
+        self.jobs = os.cpu_count() or 1
         self.integrity_check_enabled = True
+        self.verbose = False
+        self.compact_output = False
+        self.defer_backups = False
+        self.full_verification = False
+        self.parse_cache_enabled = True
+        self.cache_dir = self.root_dir / ".converter_cache"
+        # PHP CLI evaluation includes, and so executes, each file - opt-in via --php
+        self.php_bin = None
+        self.php_timeout = 5
 
         # Enterprise logging
         self.setup_enterprise_logging()
 
+    def __getstate__(self):
+        """Drop open log handlers when the converter is sent to worker processes"""
+        state = self.__dict__.copy()
+        state['_loggers'] = {}
+        return state
+
     def setup_enterprise_logging(self):
         """Setup enterprise-grade logging system"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -50,19 +361,41 @@ class EnterprisePHPToJSONConverter:
         self.conversion_log = self.log_dir / f"conversion_{timestamp}.log"
         self.integrity_log = self.log_dir / f"integrity_{timestamp}.log"
         self.backup_log = self.log_dir / f"backup_{timestamp}.log"
+        self._loggers = {}
 
         print(f"📋 Enterprise logging enabled:")
         print(f"   • Conversion log: {self.conversion_log.name}")
         print(f"   • Integrity log: {self.integrity_log.name}")
         print(f"   • Backup log: {self.backup_log.name}")
 
+    def _get_logger(self, log_file: Path) -> logging.Logger:
+        """Get the buffered logger for a log file, attaching its file handler on first use"""
+        logger = self._loggers.get(log_file)
+        if logger is None:
+            logger = logging.getLogger(f"php2json.{log_file.stem}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            if not logger.handlers:
+                handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+                handler.setFormatter(self._LOG_FORMATTER)
+                logger.addHandler(logging.handlers.MemoryHandler(self._LOG_BUFFER_RECORDS, target=handler))
+            self._loggers[log_file] = logger
+        return logger
+
     def log_to_file(self, log_file: Path, level: str, message: str):
         """Write to log file with timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {level}: {message}\n"
+        self._get_logger(log_file).info(message, extra={'tag': level})
 
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+    def flush_logs(self):
+        """Write buffered log records out to their files"""
+        for logger in self._loggers.values():
+            for handler in logger.handlers:
+                handler.flush()
+
+    def _print_detail(self, message: str):
+        """Print per-file progress details only in verbose mode"""
+        if self.verbose:
+            print(message)
 
     def create_backup_system(self):
         """Create enterprise backup system"""
@@ -75,7 +408,7 @@ class EnterprisePHPToJSONConverter:
 
         return self.backup_dir
 
-    def backup_file(self, php_file: Path) -> bool:
+    def backup_file(self, php_file: Path, content_bytes: Optional[bytes] = None, link: bool = False) -> bool:
         """Create backup of PHP file before any operations"""
         try:
             if not self.backup_dir:
@@ -86,8 +419,26 @@ class EnterprisePHPToJSONConverter:
             backup_file = self.backup_dir / relative_path
             backup_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy file to backup
-            shutil.copy2(php_file, backup_file)
+            # link is only set for a file that is about to be deleted: the backup then shares the
+            # original inode, so no bytes are copied, and unlinking the original removes just its
+            # name - the data stays alive through the backup link. A hardlink aliases the file, so an
+            # in-place edit of a kept original would change its backup too; every other backup is a
+            # copy. Hardlinking falls back to a copy across filesystems or where it is unsupported.
+            linked = False
+            if link:
+                try:
+                    os.link(php_file, backup_file)
+                    linked = True
+                except OSError:
+                    pass
+
+            if not linked:
+                if content_bytes is None:
+                    shutil.copy2(php_file, backup_file)
+                else:
+                    # Written from the bytes already in memory instead of reading the source again
+                    backup_file.write_bytes(content_bytes)
+                    shutil.copystat(php_file, backup_file)
 
             self.log_to_file(self.backup_log, "SUCCESS", f"Backed up: {php_file} -> {backup_file}")
             return True
@@ -101,120 +452,389 @@ class EnterprisePHPToJSONConverter:
         self.php_files = []
 
         print("🔍 Enterprise scanning for PHP files...")
-        for php_file in self.root_dir.rglob("*.php"):
-            if php_file.name in ["converter_en.py", "converter_vi.py", "load_json_example.php"]:
-                continue
+        # os.walk lists each directory once with scandir, so the JSON-exists check is a set lookup;
+        # skipped directories are pruned in place and never listed
+        skipped = 0
+        for dirpath, dirnames, filenames in os.walk(self.root_dir):
+            dirnames[:] = [d for d in dirnames
+                           if d not in self._SKIP_DIR_NAMES and not self._RE_BACKUP_DIR.fullmatch(d)]
+            names = set(filenames)
+            directory = None
+
+            for name in filenames:
+                if not name.endswith('.php') or name in self._SKIP_FILE_NAMES:
+                    continue
 
-            if skip_existing:
-                json_file = php_file.with_suffix('.json')
-                if json_file.exists():
-                    print(f"⏭️  Skip {php_file.relative_to(self.root_dir)} (JSON exists)")
+                if skip_existing and name[:-4] + '.json' in names:
+                    skipped += 1
+                    if self.verbose:
+                        self._print_detail(f"⏭️  Skip {os.path.relpath(os.path.join(dirpath, name), self.root_dir)} (JSON exists)")
                     continue
 
-            self.php_files.append(php_file)
+                if directory is None:
+                    directory = Path(dirpath)
+                self.php_files.append(directory / name)
 
+        if skipped and not self.verbose:
+            print(f"⏭️  Skipped {skipped} PHP files (JSON exists)")
         print(f"📊 Found {len(self.php_files)} PHP files for enterprise processing")
         self.log_to_file(self.conversion_log, "INFO", f"Found {len(self.php_files)} PHP files to process")
         return len(self.php_files)
 
-    def analyze_php_file(self, php_file: Path) -> Dict[str, Any]:
+    def prefetch_php_files(self):
+        """Ask the kernel to read ahead every queued PHP file in one pass"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+
+        for php_file in self.php_files:
+            try:
+                fd = os.open(str(php_file), os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+    def read_php_bytes(self, php_file: Path):
+        """Read a PHP file's raw content; files above the mmap threshold are mapped instead of copied onto the heap"""
+        with open(php_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= self._MMAP_THRESHOLD:
+                return f.read()
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def analyze_php_file(self, php_file: Path, content: Optional[str] = None, raw: Optional[bytes] = None) -> Dict[str, Any]:
         """Analyze PHP file structure before conversion"""
         try:
-            with open(php_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                with open(php_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+            # Size and hash come from the raw bytes already read, so the text is never re-encoded
+            if raw is None:
+                raw = content.encode('utf-8')
 
             analysis = {
-                'file_size': len(content),
-                'line_count': content.count('\n') + 1,
-                'has_php_tags': '<?php' in content or '<?=' in content,
-                'has_return_statement': re.search(r'\breturn\s+', content, re.IGNORECASE) is not None,
-                'has_variable_assignment': re.search(r'\$\w+\s*=', content) is not None,
+                'file_size': len(raw),
+                'line_count': None,
+                'has_php_tags': None,
+                'has_return_statement': None,
+                'has_variable_assignment': None,
                 'array_syntax': [],
                 'variable_names': [],
                 'encoding': 'utf-8',
-                'content_hash': hash(content)  # For integrity verification
+                'content_hash': hashlib.sha256(raw).hexdigest()  # For integrity verification
             }
 
-            # Detect array syntax types
-            if re.search(r'\[.*?\]', content, re.DOTALL):
-                analysis['array_syntax'].append('short_array')
-            if re.search(r'array\s*\(', content, re.IGNORECASE):
-                analysis['array_syntax'].append('long_array')
+            # Everything but size and hash is only reported in verbose mode - skip the full-file scans otherwise
+            if self.verbose:
+                # Line count and structure flags
+                analysis['line_count'] = content.count('\n') + 1
+                analysis['has_php_tags'] = '<?php' in content or '<?=' in content
+                analysis['has_return_statement'] = self._RE_RETURN_STMT.search(content) is not None
+                analysis['has_variable_assignment'] = self._RE_VAR_ASSIGN.search(content) is not None
+
+                # Detect array syntax types
+                found = {match.lastgroup for match in self._RE_ARRAY_SYNTAX.finditer(content)}
+                analysis['array_syntax'] = [syntax for syntax in ('short_array', 'long_array') if syntax in found]
 
-            # Extract variable names
-            var_matches = re.findall(r'\$(\w+)\s*=', content)
-            analysis['variable_names'] = list(set(var_matches))
+                # Extract variable names
+                analysis['variable_names'] = list(dict.fromkeys(self._RE_VAR_NAME.findall(content)))
 
             return analysis
 
         except Exception as e:
             return {'error': str(e)}
 
-    def parse_php_array_robust(self, content: str) -> Optional[Dict[str, Any]]:
+    def parse_php_array_robust(self, content: str, php_file: Optional[Path] = None) -> Optional[Dict[str, Any]]:
         """Multiple-strategy PHP parsing with comprehensive fallbacks"""
 
-        # Strategy 1: Advanced regex with nested structure support
-        result = self._parse_strategy_advanced_regex(content)
-        if result and len(result) > 0:
-            return result
+        # Native: let the PHP interpreter evaluate the file when it is installed
+        if self.php_bin and php_file is not None:
+            result = self._parse_with_php_cli(php_file)
+            if result and len(result) > 0:
+                return result
 
-        # Strategy 2: PHP-like tokenizer approach
-        result = self._parse_strategy_tokenizer(content)
+        # Primary: single-pass tokenizer with recursive descent parsing
+        result = self._parse_php_tokens(content)
         if result and len(result) > 0:
             return result
 
+        # Every fallback strategy only yields 'key' => value pairs, so without an arrow none can succeed
+        if '=>' not in content:
+            return None
+
+        # Fallback cascade: clean once, and only try the opener-based strategies when an opener is present
+        cleaned = self._clean_php_content(content)
+
+        if self._RE_ARRAY_PREAMBLE.search(cleaned):
+            # Strategy 1: Advanced regex with nested structure support
+            result = self._parse_strategy_advanced_regex(cleaned)
+            if result and len(result) > 0:
+                return result
+
+            # Strategy 2: PHP-like tokenizer approach
+            result = self._parse_strategy_tokenizer(cleaned)
+            if result and len(result) > 0:
+                return result
+
         # Strategy 3: Line-by-line with state machine
-        result = self._parse_strategy_state_machine(content)
+        result = self._parse_strategy_state_machine(cleaned)
         if result and len(result) > 0:
             return result
 
         # Strategy 4: Regex with manual nested handling
-        result = self._parse_strategy_manual_nested(content)
+        result = self._parse_strategy_manual_nested(cleaned)
         if result and len(result) > 0:
             return result
 
         return None
 
+    def _parse_with_php_cli(self, php_file: Path) -> Optional[Dict[str, Any]]:
+        """Evaluate the file with the PHP CLI and round-trip the array through json_encode"""
+        try:
+            proc = subprocess.run(
+                [self.php_bin, '-n', '-d', 'display_errors=stderr', '-r', self._PHP_JSON_SCRIPT, '--', str(php_file)],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=self.php_timeout
+            )
+            if proc.returncode != 0:
+                self._print_detail(f"   ⚠️  PHP CLI failed: exit code {proc.returncode}")
+                return None
+
+            data = self.decode_json_bytes(proc.stdout)
+            if isinstance(data, dict):
+                return data
+
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            self._print_detail(f"   ⚠️  PHP CLI failed: {e}")
+
+        return None
+
+    def _parse_php_tokens(self, content: str) -> Optional[Dict[str, Any]]:
+        """Primary parser: tokenize once, then parse the array with recursive descent"""
+        try:
+            tokens = self._tokenize_php(content)
+
+            for start in self._find_array_statements(tokens):
+                try:
+                    value, _ = self._parse_php_value(tokens, start)
+                except (ValueError, IndexError) as e:
+                    self._print_detail(f"   ⚠️  Primary parser failed: {e}")
+                    continue
+
+                if isinstance(value, dict) and value:
+                    return value
+
+        except Exception as e:
+            self._print_detail(f"   ⚠️  Primary parser failed: {e}")
+
+        return None
+
+    def _tokenize_php(self, content: str) -> List[Tuple[str, str]]:
+        """Split PHP source into (kind, text) tokens in a single pass"""
+        tokens = []
+        for match in self._RE_PHP_TOKEN.finditer(content):
+            kind = match.lastgroup
+            if kind != 'skip':
+                tokens.append((kind, match.group()))
+        return tokens
+
+    def _find_array_statements(self, tokens: List[Tuple[str, str]]) -> List[int]:
+        """Token indexes of arrays in `return [...]` and `$var = [...]` statements"""
+        returns = []
+        assignments = []
+
+        for i, (kind, text) in enumerate(tokens):
+            if kind == 'name' and text.lower() == 'return':
+                if self._is_array_start(tokens, i + 1):
+                    returns.append(i + 1)
+            elif kind == 'variable' and tokens[i + 1:i + 2] == [('op', '=')]:
+                if self._is_array_start(tokens, i + 2):
+                    assignments.append(i + 2)
+
+        return returns + assignments
+
+    def _is_array_start(self, tokens: List[Tuple[str, str]], i: int) -> bool:
+        """Check whether an array literal starts at token index i"""
+        if i >= len(tokens):
+            return False
+        if tokens[i] == ('op', '['):
+            return True
+        return (tokens[i][0] == 'name' and tokens[i][1].lower() == 'array'
+                and tokens[i + 1:i + 2] == [('op', '(')])
+
+    def _parse_php_value(self, tokens: List[Tuple[str, str]], i: int) -> Tuple[Any, int]:
+        """Parse one PHP value starting at token index i, return (value, next index)"""
+        kind, text = tokens[i]
+
+        if kind in ('string', 'heredoc'):
+            value = self._unescape_php_string(text) if kind == 'string' else self._decode_php_heredoc(text)
+            i += 1
+            # String concatenation: 'a' . 'b'
+            while i < len(tokens) and tokens[i] == ('op', '.'):
+                part, i = self._parse_php_value(tokens, i + 1)
+                if isinstance(part, bool) or not isinstance(part, (str, int, float)):
+                    raise ValueError(f"Cannot concatenate {type(part).__name__} to string")
+                value += str(part)
+            return value, i
+
+        if kind == 'number':
+            return self._php_number(text), i + 1
+
+        if kind == 'name':
+            lowered = text.lower()
+            if lowered in ('true', 'false'):
+                return lowered == 'true', i + 1
+            if lowered == 'null':
+                return None, i + 1
+            if lowered == 'array' and tokens[i + 1] == ('op', '('):
+                return self._parse_php_array(tokens, i + 2, ')')
+
+        if tokens[i] == ('op', '['):
+            return self._parse_php_array(tokens, i + 1, ']')
+
+        raise ValueError(f"Unsupported PHP value {text!r}")
+
+    def _php_number(self, literal: str) -> Any:
+        """Convert a PHP numeric literal to int or float using PHP's rules"""
+        sign = -1 if literal.startswith('-') else 1
+        digits = literal.lstrip('-').replace('_', '')
+        prefix = digits[:2].lower()
+
+        if prefix in ('0x', '0b', '0o'):
+            value = int(digits[2:], {'0x': 16, '0b': 2, '0o': 8}[prefix])
+        elif '.' in digits or 'e' in digits or 'E' in digits:
+            return sign * float(digits)
+        elif digits.startswith('0'):
+            # A leading zero makes an octal literal, as in PHP; 8 and 9 are a parse error there too
+            value = int(digits, 8)
+        else:
+            value = int(digits)
+
+        # Integers past PHP_INT_MAX become floats
+        return sign * (value if value <= self._PHP_INT_MAX else float(value))
+
+    def _parse_php_array(self, tokens: List[Tuple[str, str]], i: int, closer: str) -> Tuple[Any, int]:
+        """Parse array entries up to the closing bracket, return (dict or list, next index)"""
+        entries = []
+
+        while tokens[i] != ('op', closer):
+            value, i = self._parse_php_value(tokens, i)
+
+            if tokens[i][0] == 'arrow':
+                key = value
+                if isinstance(key, (dict, list)):
+                    raise ValueError("Illegal array key")
+                value, i = self._parse_php_value(tokens, i + 1)
+                entries.append((True, key, value))
+            else:
+                entries.append((False, None, value))
+
+            if tokens[i] == ('op', ','):
+                i += 1
+            elif tokens[i] != ('op', closer):
+                raise ValueError(f"Expected ',' or '{closer}' but found {tokens[i][1]!r}")
+
+        return self._build_php_array(entries), i + 1
+
+    def _build_php_array(self, entries: List[Tuple[bool, Any, Any]]) -> Any:
+        """Apply PHP key rules; sequential 0..n-1 keys become a list like json_encode"""
+        result = {}
+        next_index = 0
+
+        for has_key, key, value in entries:
+            if not has_key:
+                key = next_index
+            elif key is None:
+                key = ''
+            elif isinstance(key, (bool, float)):
+                key = int(key)
+            elif isinstance(key, str) and self._RE_PHP_INT_KEY.fullmatch(key):
+                key = int(key)
+
+            if isinstance(key, int) and key >= next_index:
+                next_index = key + 1
+            result[key] = value
+
+        if list(result) == list(range(len(result))):
+            return list(result.values())
+
+        # Interned keys: translation files repeat the same keys, so each distinct key is stored once per process
+        return {sys.intern(str(key)): value for key, value in result.items()}
+
+    def _unescape_php_string(self, literal: str) -> str:
+        """Decode a quoted PHP string literal using PHP escape rules"""
+        quote, body = literal[0], literal[1:-1]
+
+        if '\\' not in body:
+            return body
+        if quote == "'":
+            return self._RE_SQ_ESCAPE.sub(r'\1', body)
+        return self._decode_dq_escapes(body, self._RE_DQ_ESCAPE)
+
+    def _decode_php_heredoc(self, literal: str) -> str:
+        """Decode a heredoc/nowdoc literal, removing the closing marker's indentation from each line"""
+        match = self._RE_PHP_TOKEN.match(literal)
+        body = match.group('hd_body') or ''
+        indent = match.group('hd_indent')
+
+        if indent:
+            body = '\n'.join(line[len(indent):] if line.startswith(indent) else line.lstrip(' \t')
+                              for line in body.split('\n'))
+        if match.group('hd_quote') == "'":
+            return body
+        return self._decode_dq_escapes(body, self._RE_HEREDOC_ESCAPE)
+
+    def _decode_dq_escapes(self, body: str, pattern: Pattern) -> str:
+        """Decode double-quoted string / heredoc escapes; octal and hex escapes are raw bytes, as in PHP"""
+        decoded = pattern.sub(self._replace_dq_escape, body)
+        # Bytes above 0x7f are carried as surrogate escapes, then re-encoded together with the
+        # surrounding text and decoded as UTF-8, so runs like "\xC3\xA9" become one character
+        return decoded.encode('utf-8', 'surrogateescape').decode('utf-8', 'surrogateescape')
+
+    def _replace_dq_escape(self, match) -> str:
+        """Replacement callback for double-quoted string escape sequences"""
+        simple, octal, hex_code, codepoint = match.groups()
+
+        if simple:
+            return self._PHP_DQ_ESCAPES[simple]
+        if codepoint:
+            return chr(int(codepoint, 16))
+
+        # Octal and hex escapes are single bytes, not code points
+        byte = int(octal, 8) & 0xFF if octal else int(hex_code, 16)
+        return chr(byte) if byte < 0x80 else chr(0xDC00 + byte)
+
     def _parse_strategy_advanced_regex(self, content: str) -> Optional[Dict[str, Any]]:
         """Strategy 1: Advanced regex with comprehensive quote handling"""
         try:
-            # Clean PHP content first
-            content = self._clean_php_content(content)
-
-            # Find PHP array patterns with more flexibility
-            patterns = [
-                r'return\s*\[\s*(.*?)\s*\];',
-                r'return\s*array\s*\(\s*(.*?)\s*\);',
-                r'\$(?:lang|language|data|translations|messages|text|strings)\s*=\s*\[\s*(.*?)\s*\];',
-                r'\$(?:lang|language|data|translations|messages|text|strings)\s*=\s*array\s*\(\s*(.*?)\s*\);'
-            ]
-
-            array_content = None
-            for pattern in patterns:
-                match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-                if match:
-                    array_content = match.group(1)
+            # Single pass over the content; keep the first body of each declaration form
+            bodies = {}
+            for match in self._RE_ARRAY_BODY.finditer(content):
+                bodies.setdefault(match.lastgroup, match.group(match.lastgroup))
+                if match.lastgroup == self._ARRAY_BODY_PRIORITY[0]:
                     break
 
+            array_content = next((bodies[form] for form in self._ARRAY_BODY_PRIORITY if form in bodies), None)
+
             if not array_content:
                 return None
 
             return self._parse_array_content_advanced(array_content)
 
         except Exception as e:
-            print(f"   ⚠️  Strategy 1 failed: {e}")
+            self._print_detail(f"   ⚠️  Strategy 1 failed: {e}")
 
         return None
 
     def _parse_strategy_tokenizer(self, content: str) -> Optional[Dict[str, Any]]:
         """Strategy 2: Tokenizer-like approach"""
         try:
-            content = self._clean_php_content(content)
             result = {}
 
             array_start = None
-            for pattern in [r'return\s*\[', r'return\s*array\s*\(', r'\$\w+\s*=\s*\[', r'\$\w+\s*=\s*array\s*\(']:
-                match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in self._RE_ARRAY_START_PATTERNS:
+                match = pattern.search(content)
                 if match:
                     array_start = match.end()
                     break
@@ -224,22 +844,7 @@ class EnterprisePHPToJSONConverter:
 
             remaining_content = content[array_start:]
 
-            kv_pattern = r"""
-                (?:^|,|\n)\s*                    # Start or separator
-                (['\"])((?:\\.|(?!\1)[^\\])*?)\1  # Quoted key
-                \s*=>\s*                         # Arrow
-                (?:
-                    (['\"])((?:\\.|(?!\3)[^\\])*?)\3  # Quoted value
-                    |
-                    (\d+(?:\.\d+)?)              # Number
-                    |
-                    (true|false|null)            # Boolean/null
-                    |
-                    (\[(?:[^\[\]]|(?7))*\])      # Simple nested array
-                )
-            """
-
-            matches = re.finditer(kv_pattern, remaining_content, re.VERBOSE | re.DOTALL | re.IGNORECASE)
+            matches = self._RE_KV_TOKENIZER.finditer(remaining_content)
 
             for match in matches:
                 groups = match.groups()
@@ -262,14 +867,13 @@ class EnterprisePHPToJSONConverter:
             return result if result else None
 
         except Exception as e:
-            print(f"   ⚠️  Strategy 2 failed: {e}")
+            self._print_detail(f"   ⚠️  Strategy 2 failed: {e}")
 
         return None
 
     def _parse_strategy_state_machine(self, content: str) -> Optional[Dict[str, Any]]:
         """Strategy 3: State machine line-by-line parsing"""
         try:
-            content = self._clean_php_content(content)
             lines = content.split('\n')
             result = {}
 
@@ -283,7 +887,7 @@ class EnterprisePHPToJSONConverter:
                 if not line or line.startswith('//') or line.startswith('/*'):
                     continue
 
-                if not in_array and ('=>' in line or re.search(r'return\s*[\[\(]|^\$\w+\s*=\s*[\[\(]', line)):
+                if not in_array and ('=>' in line or self._RE_ARRAY_OPENER_LINE.search(line)):
                     in_array = True
 
                 if not in_array:
@@ -295,11 +899,11 @@ class EnterprisePHPToJSONConverter:
                         key_part = parts[0].strip()
                         value_part = parts[1].strip()
 
-                        key_match = re.search(r"['\"]([^'\"]*)['\"]", key_part)
+                        key_match = self._RE_QUOTED_SIMPLE.search(key_part)
                         if key_match:
                             current_key = self._clean_string_value(key_match.group(1))
 
-                            value_match = re.search(r"['\"]([^'\"]*)['\"]", value_part)
+                            value_match = self._RE_QUOTED_SIMPLE.search(value_part)
                             if value_match:
                                 result[current_key] = self._clean_string_value(value_match.group(1))
                                 current_key = None
@@ -309,31 +913,16 @@ class EnterprisePHPToJSONConverter:
             return result if result else None
 
         except Exception as e:
-            print(f"   ⚠️  Strategy 3 failed: {e}")
+            self._print_detail(f"   ⚠️  Strategy 3 failed: {e}")
 
         return None
 
     def _parse_strategy_manual_nested(self, content: str) -> Optional[Dict[str, Any]]:
         """Strategy 4: Manual nested structure handling"""
         try:
-            content = self._clean_php_content(content)
             result = {}
 
-            pattern = r"""
-                (['\"])((?:\\.|(?!\1)[^\\])*?)\1    # Key in quotes
-                \s*=>\s*                            # Arrow
-                (?:
-                    (['\"])((?:\\.|(?!\3)[^\\])*?)\3 # Simple quoted value
-                    |
-                    (\d+(?:\.\d+)?)                 # Numeric value
-                    |
-                    (true|false|null)               # Boolean/null
-                    |
-                    (\[(?:[^\[\]]++|(?7))*+\])      # Nested array (possessive)
-                )
-            """
-
-            matches = re.finditer(pattern, content, re.VERBOSE | re.DOTALL | re.IGNORECASE)
+            matches = self._RE_KV_MANUAL.finditer(content)
 
             for match in matches:
                 try:
@@ -355,73 +944,22 @@ class EnterprisePHPToJSONConverter:
                     result[clean_key] = clean_value
 
                 except Exception as e:
-                    print(f"   ⚠️  Error parsing match: {e}")
+                    self._print_detail(f"   ⚠️  Error parsing match: {e}")
                     continue
 
             return result if result else None
 
         except Exception as e:
-            print(f"   ⚠️  Strategy 4 failed: {e}")
+            self._print_detail(f"   ⚠️  Strategy 4 failed: {e}")
 
         return None
 
     def _clean_php_content(self, content: str) -> str:
         """Clean PHP content for parsing"""
-        content = re.sub(r'<\?php\s*', '', content)
-        content = re.sub(r'\?>', '', content)
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-        content = re.sub(r'#.*?$', '', content, flags=re.MULTILINE)
-
-        return content.strip()
-
-    def _clean_string_value(self, value: str) -> str:
-        """Enhanced string value cleaning with advanced quote handling"""
-        if not value:
-            return value
-
-        # Step 1: Handle PHP escape sequences first
-        value = value.replace('\\\\', '\x00BACKSLASH\x00')  # Temporary placeholder
-        value = value.replace('\\"', '"')
-        value = value.replace("\\'", "'")
-        value = value.replace('\\n', '\n')
-        value = value.replace('\\r', '\r')
-        value = value.replace('\\t', '\t')
-        value = value.replace('\x00BACKSLASH\x00', '\\')  # Restore backslashes
-
-        # Step 2: Remove surrounding quotes if they're doubled up
-        value = value.strip()
-        if (value.startswith('""') and value.endswith('""') and len(value) > 4):
-            value = value[2:-2]
-        elif (value.startswith("''") and value.endswith("''") and len(value) > 4):
-            value = value[2:-2]
-
-        # Step 3: Fix nested quote issues
-        # Remove extra quotes around HTML content
-        value = re.sub(r'"\s*<([^>]+)>\s*"', r'<\1>', value)
-        value = re.sub(r'"\s*</([^>]+)>\s*"', r'</\1>', value)
-
-        # Step 4: Clean up quote patterns that shouldn't be there
-        # Remove quotes around single words that don't need them
-        value = re.sub(r'\b"(\w+)"\b', r'\1', value)
-
-        # Step 5: Fix common quote doubling patterns
-        value = re.sub(r'""([^"]*?)""', r'"\1"', value)
-        value = re.sub(r"''([^']*?)''", r"'\1'", value)
-
-        # Step 6: Clean up extra quotes in HTML attributes
-        value = re.sub(r'([a-zA-Z-]+)=""([^"]*?)""', r'\1="\2"', value)
-
-        # Step 7: Remove quotes that appear at word boundaries inappropriately
-        value = re.sub(r'(\w)\s*"\s*(\w)', r'\1 \2', value)
-        value = re.sub(r'(\w)\s*\'\s*(\w)', r'\1 \2', value)
-
-        # Step 8: Final cleanup - remove any remaining double quotes that are clearly errors
-        # Look for patterns like: word"word or word'word
-        value = re.sub(r'(\w)"(\w)', r'\1\2', value)
-        value = re.sub(r"(\w)'(\w)", r'\1\2', value)
+        return self._RE_PHP_NOISE.sub(r'\g<string>', content).strip()
 
-        return value
+    # Fallback string value cleaning (memoized, module-level)
+    _clean_string_value = staticmethod(_clean_string_value)
 
     def _parse_nested_array(self, nested_content: str) -> Optional[str]:
         """Parse nested array content"""
@@ -433,57 +971,32 @@ class EnterprisePHPToJSONConverter:
 
     def _parse_array_content_advanced(self, content: str) -> Dict[str, Any]:
         """Enhanced array content parsing with better quote handling"""
-        result = {}
-
-        # Enhanced regex pattern for key-value pairs with proper nested quote handling
-        # This pattern handles nested quotes by using non-greedy matching and proper escaping
-        kv_pattern = r'''
-            (?:^|,|\n)\s*                           # Start or separator with whitespace
-            ([\'"])((?:\\.|(?!\1)[^\\])*?)\1        # Quoted key with escape handling
-            \s*=>\s*                                # Arrow with optional whitespace
-            ([\'"])((?:\\.|[^\\])*?)\3              # Quoted string value with better handling
-            (?=\s*(?:,|\n|$|\]))                    # Lookahead for end
-        '''
-
-        # Alternative pattern for more complex nested quotes
-        kv_pattern_alt = r'''
-            (?:^|,|\n)\s*                           # Start or separator
-            ([\'"])((?:[^\'"]|\\[\'"])*?)\1         # Key with escaped quotes
-            \s*=>\s*                                # Arrow
-            ([\'"])                                 # Opening value quote
-            ((?:                                    # Value content
-                [^\'\"\\]|                          # Normal characters
-                \\.|                                # Escaped characters
-                [\'"](?![\'"])                      # Single quotes not at boundary
-            )*?)
-            \3                                      # Closing value quote
-            (?=\s*(?:,|\n|$|\]))                    # End boundary
-        '''
-
         # Try the alternative pattern first for better nested quote handling
-        matches = list(re.finditer(kv_pattern_alt, content, re.VERBOSE | re.DOTALL | re.IGNORECASE))
+        matches = list(self._RE_KV_ADVANCED_ALT.finditer(content))
 
         if not matches:
             # Fallback to simpler pattern
-            matches = list(re.finditer(kv_pattern, content, re.VERBOSE | re.DOTALL | re.IGNORECASE))
-
+            matches = list(self._RE_KV_ADVANCED.finditer(content))
+
+        # Collect pairs and build the dict in one call once all matches are cleaned; the loop
+        # only touches locals
+        pairs = []
+        append = pairs.append
+        clean = self._clean_string_value
+        intern = sys.intern
         for match in matches:
-            groups = match.groups()
-
-            if len(groups) >= 4:
-                # Extract key
-                key = self._clean_string_value(groups[1]) if groups[1] else None
+            # Both patterns capture (key quote, key, value quote, value); a match without a key is skipped
+            _, raw_key, _, raw_value = match.groups()
+            if not raw_key:
+                continue
 
-                # Extract value - use the longer group (more content captured)
-                if len(groups) >= 4 and groups[3]:
-                    value = self._clean_string_value(groups[3])
-                elif len(groups) >= 2 and groups[1]:
-                    value = self._clean_string_value(groups[1])
-                else:
-                    continue
+            key = clean(raw_key)
+            if key:
+                key = intern(key)
+                # An empty value falls back to the key text
+                append((key, clean(raw_value) if raw_value else key))
 
-                if key:
-                    result[key] = value
+        result = dict(pairs)
 
         # If still no results, try line-by-line parsing as fallback
         if not result:
@@ -494,100 +1007,86 @@ class EnterprisePHPToJSONConverter:
     def _parse_line_by_line_fallback(self, content: str) -> Dict[str, Any]:
         """Fallback line-by-line parsing for complex quote scenarios"""
         result = {}
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('//') or line.startswith('#'):
+        # Bound once, outside the per-line loop
+        clean = self._clean_string_value
+        search_key = self._RE_FALLBACK_KEY.search
+        search_value = self._RE_FALLBACK_VALUE.search
+
+        for line_match in self._RE_FALLBACK_LINE.finditer(content):
+            line = line_match.group().strip()
+            if line.startswith(('//', '#')):
                 continue
 
-            # Look for key => value pattern
-            if '=>' in line:
-                parts = line.split('=>', 1)
-                if len(parts) == 2:
-                    key_part = parts[0].strip()
-                    value_part = parts[1].strip()
-
-                    # Remove trailing comma
-                    if value_part.endswith(','):
-                        value_part = value_part[:-1].strip()
-
-                    # Extract key
-                    key_match = re.search(r'''(['"])((?:[^'"\\]|\\.)*)?\1''', key_part)
-                    if key_match:
-                        key = self._clean_string_value(key_match.group(2) or '')
-
-                        # Extract value - handle the entire quoted string
-                        value_match = re.search(r'''(['"])((?:[^'"\\]|\\.|["'][^"']*["'])*)?\1''', value_part)
-                        if value_match:
-                            value = self._clean_string_value(value_match.group(2) or '')
-                            if key:
-                                result[key] = value
+            key_part, _, value_part = line.partition('=>')
+            key_part = key_part.strip()
+            value_part = value_part.strip()
 
-        return result
+            # Remove trailing comma
+            if value_part.endswith(','):
+                value_part = value_part[:-1].strip()
 
-    def _smart_split_array_entries(self, content: str) -> List[str]:
-        """Smart split that respects quotes and nested structures"""
-        entries = []
-        current_entry = ""
-        in_quotes = False
-        quote_char = None
-        bracket_depth = 0
-
-        i = 0
-        while i < len(content):
-            char = content[i]
-
-            if char in ['"', "'"] and (i == 0 or content[i-1] != '\\'):
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-
-            elif not in_quotes:
-                if char in ['[', '(']:
-                    bracket_depth += 1
-                elif char in [']', ')']:
-                    bracket_depth -= 1
-                elif char == ',' and bracket_depth == 0:
-                    entries.append(current_entry)
-                    current_entry = ""
-                    i += 1
-                    continue
+            # Extract key
+            key_match = search_key(key_part)
+            if key_match:
+                key = clean(key_match.group(2) or '')
 
-            current_entry += char
-            i += 1
+                # Extract value - handle the entire quoted string
+                value_match = search_value(value_part)
+                if value_match:
+                    value = clean(value_match.group(2) or '')
+                    if key:
+                        result[key] = value
 
-        if current_entry.strip():
-            entries.append(current_entry)
+        return result
 
-        return entries
+    def encode_json_output(self, data: Dict[str, Any]) -> bytes:
+        """Serialize data to UTF-8 JSON bytes in a single pass - indented, or minified when compact output is enabled"""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS if self.compact_output else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            try:
+                return orjson.dumps(data, option=option)
+            except TypeError:
+                pass
+        if self.compact_output:
+            return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def decode_json_bytes(self, payload: bytes) -> Any:
+        """Parse UTF-8 JSON bytes, through orjson when installed; anything it rejects is retried with stdlib json"""
+        if orjson is not None:
+            try:
+                return orjson.loads(payload)
+            except ValueError:
+                pass
+        return json.loads(payload.decode('utf-8'))
+
+    def write_file_bytes(self, path: Path, payload: bytes):
+        """Write bytes to a file with raw os.write calls, bypassing Python's buffered I/O layer"""
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
     def validate_json_output(self, data: Dict[str, Any]) -> Tuple[bool, str]:
         """Validate JSON output before saving"""
-        try:
-            if not data:
-                return False, "Empty data"
-
-            if not isinstance(data, dict):
-                return False, "Data is not a dictionary"
+        if not data:
+            return False, "Empty data"
 
-            if len(data) == 0:
-                return False, "No keys found"
+        if not isinstance(data, dict):
+            return False, "Data is not a dictionary"
 
-            if len(data) > 10000:
-                return False, f"Too many keys ({len(data)}), possible parsing error"
+        if len(data) == 0:
+            return False, "No keys found"
 
-            json.dumps(data, ensure_ascii=False, indent=2)
+        if len(data) > self._MAX_KEYS:
+            return False, f"Too many keys ({len(data)}), possible parsing error"
 
-            return True, f"Valid with {len(data)} keys"
+        return True, f"Valid with {len(data)} keys"
 
-        except Exception as e:
-            return False, f"JSON validation failed: {e}"
-
-    def verify_data_integrity(self, php_file: Path, json_file: Path, original_data: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
+    def verify_data_integrity(self, php_file: Path, json_file: Path, original_data: Dict[str, Any], payload: Optional[bytes] = None) -> Tuple[bool, str, Dict[str, Any]]:
         """Enterprise-grade data integrity verification"""
         integrity_report = {
             'php_file': str(php_file),
@@ -597,81 +1096,98 @@ class EnterprisePHPToJSONConverter:
             'issues_found': [],
             'data_match': False,
             'key_count_match': False,
-            'content_hash_match': False
+            'content_hash_match': False,
+            'content_hash': None
         }
 
         try:
-            print(f"      🔍 Data integrity verification...")
+            self._print_detail(f"      🔍 Data integrity verification...")
 
             # Check 1: JSON file exists and is readable
             if not json_file.exists():
                 integrity_report['issues_found'].append("JSON file does not exist")
                 return False, "JSON file missing", integrity_report
 
-            with open(json_file, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            with open(json_file, 'rb') as f:
+                json_bytes = f.read()
             integrity_report['checks_performed'].append("JSON file readability")
 
-            # Check 2: Key count comparison
-            original_key_count = len(original_data)
-            json_key_count = len(json_data)
+            # Check 2: Content verification - the bytes on disk must match the encoded payload
+            if payload is None:
+                payload = self.encode_json_output(original_data)
 
-            if original_key_count != json_key_count:
-                integrity_report['issues_found'].append(f"Key count mismatch: PHP={original_key_count}, JSON={json_key_count}")
-            else:
-                integrity_report['key_count_match'] = True
-            integrity_report['checks_performed'].append("Key count comparison")
-
-            # Check 3: Deep key-value comparison
-            missing_keys = []
-            value_mismatches = []
-
-            for key, php_value in original_data.items():
-                if key not in json_data:
-                    missing_keys.append(key)
-                elif str(json_data[key]) != str(php_value):
-                    value_mismatches.append({
-                        'key': key,
-                        'php_value': php_value,
-                        'json_value': json_data[key]
-                    })
-
-            # Check for extra keys in JSON
-            extra_keys = [key for key in json_data.keys() if key not in original_data]
-
-            if missing_keys:
-                integrity_report['issues_found'].append(f"Missing keys in JSON: {missing_keys}")
-            if extra_keys:
-                integrity_report['issues_found'].append(f"Extra keys in JSON: {extra_keys}")
-            if value_mismatches:
-                integrity_report['issues_found'].append(f"Value mismatches: {len(value_mismatches)} found")
-
-            integrity_report['checks_performed'].append("Deep key-value comparison")
-
-            # Check 4: Content hash verification (optional)
-            json_content_hash = hash(json.dumps(json_data, sort_keys=True))
-            php_content_hash = hash(json.dumps(original_data, sort_keys=True))
-
-            if json_content_hash == php_content_hash:
-                integrity_report['content_hash_match'] = True
+            content_hash_match = json_bytes == payload
+            integrity_report['content_hash'] = hashlib.sha256(json_bytes).hexdigest()
+            integrity_report['content_hash_match'] = content_hash_match
             integrity_report['checks_performed'].append("Content hash verification")
 
-            # Final assessment
-            data_integrity_passed = (
-                integrity_report['key_count_match'] and
-                len(missing_keys) == 0 and
-                len(extra_keys) == 0 and
-                len(value_mismatches) == 0
-            )
+            if content_hash_match and not self.full_verification:
+                # The file holds exactly the bytes encoded from original_data, so decoding it
+                # again would only re-test the encoder; --full-verify restores the deep comparison
+                integrity_report['key_count_match'] = True
+                data_integrity_passed = True
+            else:
+                json_data = self.decode_json_bytes(json_bytes)
+                # Fast path: one C-level dict comparison settles the common all-match case
+                data_integrity_passed = json_data == original_data
+                integrity_report['checks_performed'].append("Direct equality comparison")
 
+                if data_integrity_passed:
+                    integrity_report['key_count_match'] = True
+                else:
+                    # Mismatch: build the detailed diff report
+                    # Check 3: Key count comparison
+                    original_key_count = len(original_data)
+                    json_key_count = len(json_data)
+
+                    if original_key_count != json_key_count:
+                        integrity_report['issues_found'].append(f"Key count mismatch: PHP={original_key_count}, JSON={json_key_count}")
+                    else:
+                        integrity_report['key_count_match'] = True
+                    integrity_report['checks_performed'].append("Key count comparison")
+
+                    # Check 4: Deep key-value comparison
+                    missing_keys = []
+                    value_mismatches = []
+
+                    for key, php_value in original_data.items():
+                        if key not in json_data:
+                            missing_keys.append(key)
+                        elif str(json_data[key]) != str(php_value):
+                            value_mismatches.append({
+                                'key': key,
+                                'php_value': php_value,
+                                'json_value': json_data[key]
+                            })
+
+                    # Check for extra keys in JSON
+                    extra_keys = [key for key in json_data.keys() if key not in original_data]
+
+                    if missing_keys:
+                        integrity_report['issues_found'].append(f"Missing keys in JSON: {missing_keys}")
+                    if extra_keys:
+                        integrity_report['issues_found'].append(f"Extra keys in JSON: {extra_keys}")
+                    if value_mismatches:
+                        integrity_report['issues_found'].append(f"Value mismatches: {len(value_mismatches)} found")
+
+                    integrity_report['checks_performed'].append("Deep key-value comparison")
+
+                    data_integrity_passed = (
+                        integrity_report['key_count_match'] and
+                        len(missing_keys) == 0 and
+                        len(extra_keys) == 0 and
+                        len(value_mismatches) == 0
+                    )
+
+            # Final assessment
             integrity_report['data_match'] = data_integrity_passed
 
             if data_integrity_passed:
-                print(f"      ✅ Data integrity verified: 100% match")
+                self._print_detail(f"      ✅ Data integrity verified: 100% match")
                 self.log_to_file(self.integrity_log, "SUCCESS", f"Data integrity verified for {php_file}")
                 return True, "Data integrity verified", integrity_report
             else:
-                print(f"      ❌ Data integrity issues found: {len(integrity_report['issues_found'])} problems")
+                self._print_detail(f"      ❌ Data integrity issues found: {len(integrity_report['issues_found'])} problems")
                 self.log_to_file(self.integrity_log, "FAILED", f"Data integrity issues for {php_file}: {integrity_report['issues_found']}")
                 return False, f"Data integrity failed: {len(integrity_report['issues_found'])} issues", integrity_report
 
@@ -680,29 +1196,63 @@ class EnterprisePHPToJSONConverter:
             self.log_to_file(self.integrity_log, "ERROR", f"Data integrity verification error for {php_file}: {e}")
             return False, f"Verification error: {str(e)}", integrity_report
 
-    def auto_retry_conversion(self, php_file: Path, max_retries: int = 3) -> Tuple[bool, str, Dict[str, Any], Dict[str, Any]]:
-        """Auto-retry mechanism for failed conversions"""
-        for attempt in range(1, max_retries + 1):
-            print(f"      🔄 Conversion attempt {attempt}/{max_retries}")
+    def _parse_cache_key(self, content_hash: str) -> str:
+        """Cache file stem for this content under the current parser version and backend"""
+        backend = 'php' if self.php_bin else 'python'
+        return hashlib.sha256(f"{self._PARSER_VERSION}:{backend}:{content_hash}".encode('ascii')).hexdigest()
 
-            try:
+    def load_cached_parse(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Return previously verified data for identical file content, if cached"""
+        if not self.parse_cache_enabled:
+            return None
+
+        try:
+            with open(self.cache_dir / f"{self._parse_cache_key(content_hash)}.json", 'rb') as f:
+                data = self.decode_json_bytes(f.read())
+        except (OSError, ValueError):
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    def store_cached_parse(self, content_hash: str, payload: bytes):
+        """Store verified JSON output for this file content"""
+        if not self.parse_cache_enabled:
+            return
+
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            cache_key = self._parse_cache_key(content_hash)
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            # Write then rename, so concurrent workers never see a partial entry
+            tmp_file = self.cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+            self.write_file_bytes(tmp_file, payload)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.log_to_file(self.conversion_log, "WARNING", f"Parse cache write failed: {e}")
+
+    def parse_and_validate(self, php_file: Path, content: Optional[str] = None) -> Tuple[bool, str, Dict[str, Any]]:
+        """Parse PHP content and validate the resulting array"""
+        # Parsing is deterministic for the same content, so a failure is reported at once rather than retried
+        try:
+            if content is None:
                 with open(php_file, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                data = self.parse_php_array_robust(content)
-
-                if data is not None:
-                    is_valid, validation_msg = self.validate_json_output(data)
-                    if is_valid:
-                        return True, validation_msg, data, {'attempts': attempt}
+            data = self.parse_php_array_robust(content, php_file)
 
-                print(f"      ⚠️  Attempt {attempt} failed, retrying...")
-                time.sleep(0.2 * attempt)  # Progressive delay
+        except Exception as e:
+            self._print_detail(f"      ❌ Conversion error: {e}")
+            return False, f"Conversion error: {e}", {}
 
-            except Exception as e:
-                print(f"      ❌ Attempt {attempt} error: {e}")
+        if data is None:
+            message = "No PHP array could be parsed"
+        else:
+            is_valid, message = self.validate_json_output(data)
+            if is_valid:
+                return True, message, data
 
-        return False, f"All {max_retries} conversion attempts failed", {}, {'attempts': max_retries}
+        self._print_detail(f"      ⚠️  Conversion failed: {message}")
+        return False, f"Conversion failed: {message}", {}
 
     def convert_file_enterprise(self, php_file: Path) -> Tuple[bool, str, Dict[str, Any]]:
         """Enterprise-grade file conversion with full integrity checking"""
@@ -712,37 +1262,51 @@ class EnterprisePHPToJSONConverter:
             'strategies_tried': [],
             'validation': {},
             'integrity': {},
-            'backup_created': False,
-            'retry_attempts': 0
+            'backup_created': False
         }
 
         try:
-            print(f"   📁 Enterprise processing: {php_file.name}")
+            self._print_detail(f"   📁 Enterprise processing: {php_file.name}")
+
+            # Read the file once - backup, analysis and conversion share this content
+            content_bytes = self.read_php_bytes(php_file)
 
-            # Step 1: Create backup
-            backup_success = self.backup_file(php_file)
-            conversion_info['backup_created'] = backup_success
+            # Step 1: Create backup - deferred when originals are deleted, see run_enterprise
+            if not self.defer_backups:
+                backup_success = self.backup_file(php_file, content_bytes)
+                conversion_info['backup_created'] = backup_success
 
-            if not backup_success:
-                return False, "Backup creation failed - aborting for safety", conversion_info
+                if not backup_success:
+                    return False, "Backup creation failed - aborting for safety", conversion_info
 
             # Step 2: Analyze file
-            analysis = self.analyze_php_file(php_file)
+            try:
+                # Universal newlines, as text-mode open() would give
+                content = str(content_bytes, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            except UnicodeDecodeError as e:
+                return False, f"File analysis failed: {e}", conversion_info
+
+            analysis = self.analyze_php_file(php_file, content, content_bytes)
             conversion_info['analysis'] = analysis
 
             if 'error' in analysis:
                 return False, f"File analysis failed: {analysis['error']}", conversion_info
 
-            print(f"      📏 Size: {analysis['file_size']} bytes, Lines: {analysis['line_count']}")
+            self._print_detail(f"      📏 Size: {analysis['file_size']} bytes, Lines: {analysis['line_count']}")
             if analysis['variable_names']:
-                print(f"      🔤 Variables: {', '.join(analysis['variable_names'][:3])}{'...' if len(analysis['variable_names']) > 3 else ''}")
+                self._print_detail(f"      🔤 Variables: {', '.join(analysis['variable_names'][:3])}{'...' if len(analysis['variable_names']) > 3 else ''}")
 
-            # Step 3: Convert with auto-retry
-            success, message, data, retry_info = self.auto_retry_conversion(php_file, self.max_retries)
-            conversion_info['retry_attempts'] = retry_info.get('attempts', 0)
+            # Step 3: Parse and validate, unless identical content was already converted and verified
+            data = self.load_cached_parse(analysis['content_hash'])
+            cache_hit = data is not None
+
+            if cache_hit:
+                self._print_detail(f"      ⚡ Parse cache hit - reusing verified result")
+            else:
+                success, message, data = self.parse_and_validate(php_file, content)
 
-            if not success:
-                return False, message, conversion_info
+                if not success:
+                    return False, message, conversion_info
 
             # Step 4: Validate JSON output
             is_valid, validation_msg = self.validate_json_output(data)
@@ -751,17 +1315,25 @@ class EnterprisePHPToJSONConverter:
             if not is_valid:
                 return False, f"Validation failed: {validation_msg}", conversion_info
 
-            print(f"      ✅ Conversion successful: {validation_msg}")
+            self._print_detail(f"      ✅ Conversion successful: {validation_msg}")
 
-            # Step 5: Save JSON file
+            # Step 5: Encode once and save JSON file; the payload is reused for verification
             json_file = php_file.with_suffix('.json')
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            payload = self.encode_json_output(data)
+            # Write then rename, so an interrupted run never leaves a truncated JSON file beside its PHP source
+            tmp_file = json_file.with_name(f"{json_file.name}.{os.getpid()}.tmp")
+            try:
+                self.write_file_bytes(tmp_file, payload)
+                os.replace(tmp_file, json_file)
+            except OSError:
+                if tmp_file.exists():
+                    tmp_file.unlink()
+                raise
 
             # Step 6: Enterprise data integrity verification
             if self.integrity_check_enabled:
                 integrity_passed, integrity_msg, integrity_report = self.verify_data_integrity(
-                    php_file, json_file, data
+                    php_file, json_file, data, payload
                 )
                 conversion_info['integrity'] = integrity_report
 
@@ -771,7 +1343,9 @@ class EnterprisePHPToJSONConverter:
                         json_file.unlink()
                     return False, f"Data integrity check failed: {integrity_msg}", conversion_info
 
-                self.verified_files.append(php_file)
+            # Remember the verified output so unchanged content skips parsing on later runs
+            if not cache_hit:
+                self.store_cached_parse(analysis['content_hash'], payload)
 
             self.log_to_file(self.conversion_log, "SUCCESS", f"Enterprise conversion completed: {php_file}")
             return True, f"{validation_msg} + integrity verified", conversion_info
@@ -779,6 +1353,9 @@ class EnterprisePHPToJSONConverter:
         except Exception as e:
             self.log_to_file(self.conversion_log, "ERROR", f"Enterprise conversion error for {php_file}: {e}")
             return False, f"Enterprise conversion error: {str(e)}", conversion_info
+        finally:
+            # One batched log write per file; pool workers exit without running logging's atexit flush
+            self.flush_logs()
 
     def safe_delete_php_file(self, php_file: Path) -> bool:
         """Safely delete PHP file with multiple confirmations"""
@@ -787,15 +1364,21 @@ class EnterprisePHPToJSONConverter:
             json_file = php_file.with_suffix('.json')
 
             if not json_file.exists():
-                print(f"      ❌ JSON file missing, cannot delete {php_file.name}")
+                self._print_detail(f"      ❌ JSON file missing, cannot delete {php_file.name}")
                 return False
 
             # Read and verify the JSON file one more time
-            with open(json_file, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            with open(json_file, 'rb') as f:
+                json_data = self.decode_json_bytes(f.read())
 
             if not json_data or len(json_data) == 0:
-                print(f"      ❌ JSON file empty, cannot delete {php_file.name}")
+                self._print_detail(f"      ❌ JSON file empty, cannot delete {php_file.name}")
+                return False
+
+            # Back up just before deleting, by hardlink, so only files that really are deleted share
+            # their inode with the backup
+            if not self.backup_file(php_file, link=True):
+                self._print_detail(f"      ❌ Backup failed, cannot delete {php_file.name}")
                 return False
 
             # Safe deletion
@@ -819,10 +1402,14 @@ class EnterprisePHPToJSONConverter:
             return
 
         print(f"\n🎯 Enterprise Processing Features:")
+        if self.php_bin:
+            print(f"   • Native PHP evaluation via {self.php_bin}")
         print(f"   • Automatic backup system")
         print(f"   • Data integrity verification")
-        print(f"   • Auto-retry with {self.max_retries} attempts")
-        print(f"   • Deep comparison PHP ↔ JSON")
+        if self.jobs > 1:
+            print(f"   • Parallel processing with {self.jobs} worker processes")
+        if self.full_verification:
+            print(f"   • Deep comparison PHP ↔ JSON")
         print(f"   • Enterprise logging and audit trails")
         print(f"   • Safe deletion with multiple confirmations")
 
@@ -838,48 +1425,100 @@ class EnterprisePHPToJSONConverter:
                 confirm2 = input("🛡️  Final confirmation: Delete PHP files after 100% integrity verification? (y/N): ").strip().lower()
                 delete_php = confirm2 in ['y', 'yes']
 
+        # When originals are deleted, backups are taken once each file's outcome is known: converted
+        # files are hardlinked by safe_delete_php_file right before deletion, failed ones are copied here
+        self.defer_backups = delete_php
         print(f"\n🔄 Starting enterprise conversion of {count} files...")
         print("=" * 70)
 
-        failed_details = []
+        error_summary = Counter()
         integrity_failures = []
 
-        for i, php_file in enumerate(self.php_files, 1):
-            print(f"\n📊 [{i}/{count}] {php_file.relative_to(self.root_dir)}")
-
-            success, message, info = self.convert_file_enterprise(php_file)
-
-            if success:
-                self.converted_count += 1
-                print(f"   ✅ {php_file.name} -> {php_file.stem}.json ({message})")
-
-                if delete_php:
-                    if self.safe_delete_php_file(php_file):
-                        self.deleted_count += 1
-                        print(f"   🗑️  Safely deleted {php_file.name}")
-                    else:
-                        print(f"   ⚠️  Could not safely delete {php_file.name}")
+        if not self.backup_dir:
+            self.create_backup_system()
+
+        # Queue readahead for all files so disk reads overlap with parsing
+        self.prefetch_php_files()
+
+        executor = None
+        if self.jobs > 1 and count > 1:
+            # Dispatch files to worker processes; results are collected in order in the parent
+            # Flush buffered parent records first - forked workers would inherit and rewrite them
+            self.flush_logs()
+            workers = min(self.jobs, count)
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,))
+            results = executor.map(_convert_one, self.php_files, chunksize=max(1, count // (workers * 4)))
+        else:
+            results = map(self.convert_file_enterprise, self.php_files)
+
+        # Deletions run on one background thread so the loop can move on to the next result;
+        # their outcomes are reported once the thread has drained
+        deleter = ThreadPoolExecutor(max_workers=1) if delete_php else None
+        deletions = []
+
+        # Status lines are buffered and written in batches; verbose runs flush every file so
+        # they stay in step with the detail output
+        status_lines = []
+        try:
+            for i, (php_file, (success, message, info)) in enumerate(zip(self.php_files, results), 1):
+                name = php_file.name
+                status_lines.append(f"\n📊 [{i}/{count}] {php_file.relative_to(self.root_dir)}\n")
+
+                if success:
+                    self.converted_count += 1
+                    if info.get('integrity', {}).get('data_match', False):
+                        self.verified_files.append(php_file)
+                    status_lines.append(f"   ✅ {name} -> {name[:-4]}.json ({message})\n")
+
+                    if delete_php:
+                        deletions.append((php_file, deleter.submit(self.safe_delete_php_file, php_file)))
+                else:
+                    self.failed_count += 1
+                    self.failed_files.append(php_file)
+                    if self.defer_backups:
+                        self.backup_file(php_file)
+
+                    # Check if it was an integrity failure
+                    if 'integrity' in info and not info['integrity'].get('data_match', False):
+                        integrity_failures.append(php_file)
+
+                    # Only the error type is reported, so the failure's info dict is not kept
+                    error_summary[message.partition(':')[0]] += 1
+                    status_lines.append(f"   ❌ {name}: {message}\n")
+
+                if self.verbose or i % self._STATUS_FLUSH_INTERVAL == 0:
+                    sys.stdout.write(''.join(status_lines))
+                    status_lines.clear()
+
+                if executor is None and self.processing_delay > 0:
+                    time.sleep(self.processing_delay)
+        finally:
+            if status_lines:
+                sys.stdout.write(''.join(status_lines))
+                status_lines.clear()
+            if executor is not None:
+                executor.shutdown()
+            if deleter is not None:
+                deleter.shutdown()
+
+        for php_file, deletion in deletions:
+            if deletion.result():
+                self.deleted_count += 1
+                status_lines.append(f"   🗑️  Safely deleted {php_file.name}\n")
             else:
-                self.failed_count += 1
-                self.failed_files.append(php_file)
+                status_lines.append(f"   ⚠️  Could not safely delete {php_file.name}\n")
+        if deletions:
+            sys.stdout.write('\n' + ''.join(status_lines))
 
-                # Check if it was an integrity failure
-                if 'integrity' in info and not info['integrity'].get('data_match', False):
-                    integrity_failures.append(php_file)
+        self.flush_logs()
+        self._print_enterprise_results(error_summary, integrity_failures)
 
-                failed_details.append({
-                    'file': php_file.name,
-                    'error': message,
-                    'info': info
-                })
-                print(f"   ❌ {php_file.name}: {message}")
+        # Show beautiful credit banner after results - interactive terminals only, so redirected
+        # output and CI logs stay free of it
+        if sys.stdout.isatty():
+            self._show_credit_banner()
 
-            if self.processing_delay > 0:
-                time.sleep(self.processing_delay)
-
-        self._print_enterprise_results(failed_details, integrity_failures)
-
-    def _print_enterprise_results(self, failed_details: List[Dict], integrity_failures: List[Path]):
+    def _print_enterprise_results(self, error_summary: Counter, integrity_failures: List[Path]):
         """Print comprehensive enterprise results"""
         print(f"\n" + "=" * 70)
         print(f"🏢 ENTERPRISE CONVERSION RESULTS:")
@@ -894,14 +1533,9 @@ class EnterprisePHPToJSONConverter:
         if self.backup_dir:
             print(f"   🛡️  Backup directory: {self.backup_dir.name}")
 
-        if failed_details:
+        if error_summary:
             print(f"\n❌ FAILURE ANALYSIS:")
-            error_summary = {}
-            for detail in failed_details:
-                error_type = detail['error'].split(':')[0]
-                error_summary[error_type] = error_summary.get(error_type, 0) + 1
-
-            for error_type, count in error_summary.items():
+            for error_type, count in error_summary.most_common():
                 print(f"   • {error_type}: {count} files")
 
         success_rate = (self.converted_count / len(self.php_files)) * 100 if self.php_files else 0
@@ -919,45 +1553,52 @@ class EnterprisePHPToJSONConverter:
             print(f"   • Backup directory contains original files for recovery")
             print(f"   • Consider manual review of complex PHP structures")
 
-        # Show beautiful credit banner after results
-        self._show_credit_banner()
-
     def _show_credit_banner(self):
         """Display beautiful credit banner with contact information"""
-        print(f"\n" + "═" * 70)
-        print("╔" + "═" * 68 + "╗")
-        print("║" + " " * 68 + "║")
-        print("║" + "   ██████╗ ██╗  ██╗██████╗ ██████╗      ██╗███████╗ ██████╗ ███╗   ██╗".center(68) + "║")
-        print("║" + "   ██╔══██╗██║  ██║██╔══██╗╚════██╗     ██║██╔════╝██╔═══██╗████╗  ██║".center(68) + "║")
-        print("║" + "   ██████╔╝███████║██████╔╝ █████╔╝     ██║███████╗██║   ██║██╔██╗ ██║".center(68) + "║")
-        print("║" + "   ██╔═══╝ ██╔══██║██╔═══╝ ██╔═══╝ ██   ██║╚════██║██║   ██║██║╚██╗██║".center(68) + "║")
-        print("║" + "   ██║     ██║  ██║██║     ███████╗╚█████╔╝███████║╚██████╔╝██║ ╚████║".center(68) + "║")
-        print("║" + "   ╚═╝     ╚═╝  ╚═╝╚═╝     ╚══════╝ ╚════╝ ╚══════╝ ╚═════╝ ╚═╝  ╚═══╝".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "🚀 ENTERPRISE PHP TO JSON LANGUAGE CONVERTER 🚀".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "🎯 CREATED BY: KÊNH TÁO".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "📱 TELEGRAM: @QTUNUy".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "🌐 WEBSITES:".center(68) + "║")
-        print("║" + "• CertApple.com  • Kenhtao.net  • kenhtao.site  • iPA.KenhTao.net".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "💝 Thank you for using PHP2JSON Enterprise Converter! 💝".center(68) + "║")
-        print("║" + "⭐ If this tool helped you, please star our GitHub repository ⭐".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("║" + "🔔 For updates and support, follow us on Telegram: @QTUNUy 🔔".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("╚" + "═" * 68 + "╝")
-        print("═" * 70)
+        sys.stdout.write(_CREDIT_BANNER)
+
+# Process pool workers - each worker process receives its own copy of the converter once
+_worker_converter = None
+
+def _init_worker(converter):
+    """Store the converter in the worker process global state"""
+    global _worker_converter
+    _worker_converter = converter
+
+def _convert_one(php_file):
+    """Convert a single file inside a worker process"""
+    return _worker_converter.convert_file_enterprise(php_file)
 
 def main():
+    parser = argparse.ArgumentParser(description="Enterprise PHP language files to JSON converter")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count, 1 = sequential)")
+    parser.add_argument('--delay', type=float, default=0.0, metavar='SECONDS',
+                        help="pause this many seconds between files in sequential mode (default: 0)")
+    parser.add_argument('--php', action='store_true',
+                        help="evaluate files with the PHP CLI when php is on PATH - this executes each file's code")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="do not read or write the parse cache (.converter_cache/)")
+    parser.add_argument('--compact', action='store_true',
+                        help="write minified JSON (no indentation) for smaller files and faster encoding")
+    parser.add_argument('--full-verify', action='store_true',
+                        help="always re-parse each written JSON file and deep-compare it with the parsed data")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="show per-file parsing and verification details")
+    args = parser.parse_args()
+
     try:
         converter = EnterprisePHPToJSONConverter()
+        converter.jobs = max(1, args.jobs)
+        converter.processing_delay = max(0.0, args.delay)
+        converter.parse_cache_enabled = not args.no_cache
+        if args.php:
+            converter.php_bin = shutil.which("php")
+            if not converter.php_bin:
+                print("⚠️ --php given but php was not found on PATH - using the built-in parser")
+        converter.verbose = args.verbose
+        converter.compact_output = args.compact
+        converter.full_verification = args.full_verify
         converter.run_enterprise()
     except KeyboardInterrupt:
         print("\n⚠️ Enterprise conversion stopped by user")
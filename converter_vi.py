@@ -7,24 +7,320 @@ Công cụ production-ready với data integrity verification và backup system
 Tính năng:
 - Data integrity verification giữa PHP và JSON
 - Hệ thống backup tự động trước mọi thao tác
-- Deep comparison và validation của dữ liệu converted
-- Cơ chế auto-retry cho conversions thất bại
+- Deep comparison và validation của dữ liệu converted (--full-verify)
 - Enterprise-grade logging và audit trails
 - Khả năng rollback để đảm bảo an toàn
 - Production-level error handling
 """
 
 import os
+import argparse
 import re
 import json
+import logging
+import logging.handlers
+import mmap
+import hashlib
 import sys
 import time
 import shutil
+import subprocess
+import functools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Pattern
 from datetime import datetime
 
+try:
+    import orjson  # Tùy chọn: encode JSON nhanh hơn khi được cài đặt
+except ImportError:
+    orjson = None
+
+# Credit banner - được ghép một lần khi import và ghi ra stdout trong một lần gọi
+_CREDIT_BANNER = '\n'.join((
+    "\n" + "═" * 75,
+    "╔" + "═" * 73 + "╗",
+    "║" + " " * 73 + "║",
+    "║" + "   ██████╗ ██╗  ██╗██████╗ ██████╗      ██╗███████╗ ██████╗ ███╗   ██╗".center(73) + "║",
+    "║" + "   ██╔══██╗██║  ██║██╔══██╗╚════██╗     ██║██╔════╝██╔═══██╗████╗  ██║".center(73) + "║",
+    "║" + "   ██████╔╝███████║██████╔╝ █████╔╝     ██║███████╗██║   ██║██╔██╗ ██║".center(73) + "║",
+    "║" + "   ██╔═══╝ ██╔══██║██╔═══╝ ██╔═══╝ ██   ██║╚════██║██║   ██║██║╚██╗██║".center(73) + "║",
+    "║" + "   ██║     ██║  ██║██║     ███████╗╚█████╔╝███████║╚██████╔╝██║ ╚████║".center(73) + "║",
+    "║" + "   ╚═╝     ╚═╝  ╚═╝╚═╝     ╚══════╝ ╚════╝ ╚══════╝ ╚═════╝ ╚═╝  ╚═══╝".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "🚀 ENTERPRISE PHP TO JSON LANGUAGE CONVERTER 🚀".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "🎯 TẠO BỞI: KÊNH TÁO".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "📱 TELEGRAM: @QTUNUy".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "🌐 WEBSITES:".center(73) + "║",
+    "║" + "• CertApple.com  • Kenhtao.net  • kenhtao.site  • iPA.KenhTao.net".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "💝 Cảm ơn bạn đã sử dụng PHP2JSON Enterprise Converter! 💝".center(73) + "║",
+    "║" + "⭐ Nếu tool này hữu ích, hãy star GitHub repository của chúng tôi ⭐".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "║" + "🔔 Để nhận updates và support, hãy follow Telegram: @QTUNUy 🔔".center(73) + "║",
+    "║" + " " * 73 + "║",
+    "╚" + "═" * 73 + "╝",
+    "═" * 75,
+)) + '\n'
+
+# Timestamp của log - được format một lần mỗi giây thay vì mỗi record
+class _SecondCachedFormatter(logging.Formatter):
+    """Log formatter chỉ render mỗi giây timestamp khác nhau một lần"""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._cached_time = (second, formatted)
+        return formatted
+
+# Làm sạch string value cho các fallback parser - đặt ở mức module để _clean_string_value có thể
+# được memoize mà không giữ tham chiếu tới converter instance
+_RE_VALUE_ESCAPE = re.compile(r'\\([\\"\'nrt])')
+_VALUE_ESCAPES = {'\\': '\\', '"': '"', "'": "'", 'n': '\n', 'r': '\r', 't': '\t'}
+
+_RE_QUOTED_HTML_OPEN = re.compile(r'"\s*<([^>]+)>\s*"')
+_RE_QUOTED_HTML_CLOSE = re.compile(r'"\s*</([^>]+)>\s*"')
+_RE_QUOTED_WORD = re.compile(r'\b"(\w+)"\b')
+_RE_DOUBLED_DQUOTES = re.compile(r'""([^"]*?)""')
+_RE_DOUBLED_SQUOTES = re.compile(r"''([^']*?)''")
+_RE_DOUBLED_ATTR_QUOTES = re.compile(r'([a-zA-Z-]+)=""([^"]*?)""')
+_RE_SPACED_DQUOTE = re.compile(r'(\w)\s*"\s*(\w)')
+_RE_SPACED_SQUOTE = re.compile(r'(\w)\s*\'\s*(\w)')
+_RE_INNER_DQUOTE = re.compile(r'(\w)"(\w)')
+_RE_INNER_SQUOTE = re.compile(r"(\w)'(\w)")
+
+def _replace_value_escape(match) -> str:
+    """Callback thay thế cho escape sequences trong string value ở fallback"""
+    return _VALUE_ESCAPES[match.group(1)]
+
+# File ngôn ngữ lặp lại nhiều value (OK, Cancel...) trong cùng file và giữa các file; kết quả
+# chỉ phụ thuộc vào value
+@functools.lru_cache(maxsize=65536)
+def _clean_string_value(value: str) -> str:
+    """Làm sạch giá trị chuỗi với xử lý nâng cao các dấu ngoặc kép"""
+    if not value:
+        return value
+
+    # Bước 1: Xử lý PHP escape sequences trước - một lượt từ trái sang phải, nên
+    # backslash đã escape không bị đọc lại thành escape khác
+    if '\\' in value:
+        value = _RE_VALUE_ESCAPE.sub(_replace_value_escape, value)
+
+    # Bước 2: Loại bỏ dấu ngoặc bao quanh nếu bị lặp
+    value = value.strip()
+    if (value.startswith('""') and value.endswith('""') and len(value) > 4):
+        value = value[2:-2]
+    elif (value.startswith("''") and value.endswith("''") and len(value) > 4):
+        value = value[2:-2]
+
+    # Các bước 3-8 chỉ sửa dấu ngoặc kép/đơn; phần lớn value không có
+    if '"' not in value and "'" not in value:
+        return value
+
+    # Bước 3: Sửa các vấn đề nested quotes
+    # Loại bỏ dấu ngoặc thừa xung quanh HTML content
+    value = _RE_QUOTED_HTML_OPEN.sub(r'<\1>', value)
+    value = _RE_QUOTED_HTML_CLOSE.sub(r'</\1>', value)
+
+    # Bước 4: Làm sạch các pattern dấu ngoặc không cần thiết
+    # Loại bỏ dấu ngoặc xung quanh từ đơn không cần
+    value = _RE_QUOTED_WORD.sub(r'\1', value)
+
+    # Bước 5: Sửa các pattern dấu ngoặc bị lặp
+    value = _RE_DOUBLED_DQUOTES.sub(r'"\1"', value)
+    value = _RE_DOUBLED_SQUOTES.sub(r"'\1'", value)
+
+    # Bước 6: Làm sạch dấu ngoặc thừa trong HTML attributes
+    value = _RE_DOUBLED_ATTR_QUOTES.sub(r'\1="\2"', value)
+
+    # Bước 7: Loại bỏ dấu ngoặc xuất hiện không đúng chỗ
+    value = _RE_SPACED_DQUOTE.sub(r'\1 \2', value)
+    value = _RE_SPACED_SQUOTE.sub(r'\1 \2', value)
+
+    # Bước 8: Làm sạch cuối cùng - loại bỏ dấu ngoặc kép thừa
+    # Tìm các pattern như: word"word hoặc word'word
+    value = _RE_INNER_DQUOTE.sub(r'\1\2', value)
+    value = _RE_INNER_SQUOTE.sub(r'\1\2', value)
+
+    return value
+
 class EnterprisePHPToJSONConverter:
+    # Regex patterns biên dịch sẵn - compile một lần khi load class và dùng chung cho mọi file
+    # Keyword PHP không phân biệt hoa thường, nên chỉ chúng được bọc trong nhóm (?i:...);
+    # phần còn lại của mỗi pattern (chuỗi, ngoặc, khoảng trắng) match phân biệt hoa thường
+    # Phân tích file
+    _RE_RETURN_STMT = re.compile(r'\b(?i:return)\s+')
+    _RE_VAR_ASSIGN = re.compile(r'\$\w+\s*=')
+    _RE_ARRAY_SYNTAX = re.compile(r'(?P<short_array>\[)|(?P<long_array>(?i:array)\s*\()')
+    _RE_VAR_NAME = re.compile(r'\$(\w+)\s*=')
+
+    # Parser chính: PHP tokenizer một lượt (nhánh catch-all giữ các token liên tục)
+    _RE_PHP_TOKEN = re.compile(r"""
+        (?P<skip>\s+|//[^\n]*|\#[^\n]*|/\*.*?\*/|<\?php|<\?=?|\?>)        # Khoảng trắng, comments, PHP tags
+        | (?P<string>'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*")  # Chuỗi trong quotes
+        | (?P<heredoc><<<[ \t]*(?P<hd_quote>["']?)(?P<hd_label>[A-Za-z_]\w*)(?P=hd_quote)\n(?:(?P<hd_body>.*?)\n)??(?P<hd_indent>[ \t]*)(?P=hd_label)\b)  # Heredoc / nowdoc
+        | (?P<number>-?(?:0[xX][0-9a-fA-F]+(?:_[0-9a-fA-F]+)*            # Số nguyên hoặc số thực: hex, binary, octal, thập phân, dấu phân cách _
+            | 0[bB][01]+(?:_[01]+)* | 0[oO][0-7]+(?:_[0-7]+)*
+            | (?:\d+(?:_\d+)*(?:\.(?:\d+(?:_\d+)*)?)? | \.\d+(?:_\d+)*)(?:[eE][+-]?\d+(?:_\d+)*)?))
+        | (?P<arrow>=>)                                                  # Mũi tên key-value
+        | (?P<variable>\$\w+)                                            # Biến
+        | (?P<name>[A-Za-z_]\w*)                                         # Keyword hoặc hằng số
+        | (?P<op>[\[\](),;=.])                                           # Dấu câu
+        | (?P<other>.)                                                   # Mọi ký tự khác
+    """, re.VERBOSE | re.DOTALL)
+    _RE_SQ_ESCAPE = re.compile(r"\\([\\'])")
+    _RE_DQ_ESCAPE = re.compile(r'\\(?:([ntrvef\\$"])|([0-7]{1,3})|x([0-9A-Fa-f]{1,2})|u\{([0-9A-Fa-f]+)\})')
+    # Heredoc dùng cùng các escape trừ \", vẫn giữ nguyên là backslash và dấu ngoặc kép
+    _RE_HEREDOC_ESCAPE = re.compile(r'\\(?:([ntrvef\\$])|([0-7]{1,3})|x([0-9A-Fa-f]{1,2})|u\{([0-9A-Fa-f]+)\})')
+    _RE_PHP_INT_KEY = re.compile(r'-?[1-9]\d*|0')
+    _PHP_DQ_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'v': '\v', 'e': '\x1b', 'f': '\f', '\\': '\\', '$': '$', '"': '"'}
+    _PHP_INT_MAX = 2 ** 63 - 1
+
+    # Làm sạch PHP content: tag mở/đóng và comment //, /* */, # được xóa trong một lượt leftmost-first.
+    # Chuỗi trong dấu ngoặc cũng được match và thay lại nguyên vẹn, nên các marker bên trong (URL,
+    # màu '#') được giữ lại
+    _RE_PHP_NOISE = re.compile(
+        r'''(?P<string>'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*")'''
+        r'|<\?php\s*|\?>|//[^\n]*|/\*.*?\*/|#[^\n]*',
+        re.DOTALL
+    )
+
+    # Chiến lược 1: trích xuất nội dung mảng - một alternation trong lookahead (match chồng
+    # lấn, không dạng nào che dạng khác) quét một lần; khi có nhiều dạng
+    # thì dạng đứng trước trong _ARRAY_BODY_PRIORITY được ưu tiên, như khi search riêng lẻ
+    _RE_ARRAY_BODY = re.compile(
+        r'(?=(?i:return)\s*(?:\[\s*(?P<return_short>.*?)\s*\];|(?i:array)\s*\(\s*(?P<return_long>.*?)\s*\);)'
+        r'|\$(?i:lang|language|data|translations|messages|text|strings)\s*=\s*'
+        r'(?:\[\s*(?P<var_short>.*?)\s*\];|(?i:array)\s*\(\s*(?P<var_long>.*?)\s*\);))',
+        re.DOTALL
+    )
+    _ARRAY_BODY_PRIORITY = ('return_short', 'return_long', 'var_short', 'var_long')
+
+    # Chiến lược 2: phát hiện điểm bắt đầu mảng và tokenizer key-value
+    _RE_ARRAY_START_PATTERNS = (
+        re.compile(r'(?i:return)\s*\['),
+        re.compile(r'(?i:return)\s*(?i:array)\s*\('),
+        re.compile(r'\$\w+\s*=\s*\['),
+        re.compile(r'\$\w+\s*=\s*(?i:array)\s*\('),
+    )
+
+    # Fallback dispatch: mọi array opener mà chiến lược 1 và 2 có thể bám vào
+    _RE_ARRAY_PREAMBLE = re.compile(r'(?:(?i:return)|\$\w+\s*=)\s*(?:\[|(?i:array)\s*\()')
+
+    # Module re của Python không hỗ trợ recursive groups, nên nested array chỉ match một cấp.
+    # Chuỗi trong quotes dùng dạng unrolled-loop [^q\\]*(?:\\.[^q\\]*)*: mỗi ký tự chỉ có
+    # một cách match, nên khi match thất bại không bị backtracking theo hàm mũ.
+    _RE_KV_TOKENIZER = re.compile(r"""
+        (?:^|,|\n)\s*                                           # Bắt đầu hoặc separator
+        (['\"])([^'"\\]*(?:(?:\\.|(?!\1)['"])[^'"\\]*)*)\1      # Quoted key
+        \s*=>\s*                                                # Mũi tên
+        (?:
+            (['\"])([^'"\\]*(?:(?:\\.|(?!\3)['"])[^'"\\]*)*)\3  # Quoted value
+            |
+            (\d+(?:\.\d+)?)                                     # Số
+            |
+            ((?i:true|false|null))                              # Boolean/null
+            |
+            (\[(?:[^\[\]]|\[[^\[\]]*\])*\])                     # Simple nested array
+        )
+    """, re.VERBOSE | re.DOTALL)
+
+    # Chiến lược 3: state machine line-by-line
+    _RE_ARRAY_OPENER_LINE = re.compile(r'return\s*[\[\(]|^\$\w+\s*=\s*[\[\(]')
+    _RE_QUOTED_SIMPLE = re.compile(r"['\"]([^'\"]*)['\"]")
+
+    # Chiến lược 4: xử lý nested thủ công
+    _RE_KV_MANUAL = re.compile(r"""
+        (['\"])([^'"\\]*(?:(?:\\.|(?!\1)['"])[^'"\\]*)*)\1      # Key trong quotes
+        \s*=>\s*                                                # Mũi tên
+        (?:
+            (['\"])([^'"\\]*(?:(?:\\.|(?!\3)['"])[^'"\\]*)*)\3  # Simple quoted value
+            |
+            (\d+(?:\.\d+)?)                                     # Numeric value
+            |
+            ((?i:true|false|null))                              # Boolean/null
+            |
+            (\[(?:[^\[\]]|\[[^\[\]]*\])*\])                     # Nested array (một cấp)
+        )
+    """, re.VERBOSE | re.DOTALL)
+
+    # Phân tích nội dung mảng nâng cao - pattern không có chữ cái, nên không cần IGNORECASE
+    _RE_KV_ADVANCED = re.compile(r'''
+        (?:^|,|\n)\s*                           # Bắt đầu hoặc dấu phân cách với khoảng trắng
+        ([\'"])((?:\\.|(?!\1)[^\\])*?)\1        # Key có dấu ngoặc với xử lý escape
+        \s*=>\s*                                # Mũi tên với khoảng trắng tùy chọn
+        ([\'"])((?:\\.|[^\\])*?)\3              # Giá trị chuỗi có dấu ngoặc với xử lý tốt hơn
+        (?=\s*(?:,|\n|$|\]))                    # Lookahead cho kết thúc
+    ''', re.VERBOSE | re.DOTALL)
+
+    _RE_KV_ADVANCED_ALT = re.compile(r'''
+        (?:^|,|\n)\s*                           # Bắt đầu hoặc dấu phân cách
+        ([\'"])((?:[^\'"]|\\[\'"])*?)\1         # Key với escaped quotes
+        \s*=>\s*                                # Mũi tên
+        ([\'"])                                 # Dấu ngoặc mở của value
+        ((?:                                    # Nội dung value
+            [^\'\"\\]|                          # Ký tự bình thường
+            \\.|                                # Ký tự escaped
+            [\'"](?![\'"])                      # Dấu ngoặc đơn không ở boundary
+        )*?)
+        \3                                      # Dấu ngoặc đóng của value
+        (?=\s*(?:,|\n|$|\]))                    # Boundary kết thúc
+    ''', re.VERBOSE | re.DOTALL)
+
+    # Fallback line-by-line: chỉ duyệt các dòng có chứa '=>'
+    _RE_FALLBACK_LINE = re.compile(r'^.*=>.*$', re.MULTILINE)
+    _RE_FALLBACK_KEY = re.compile(r'''(['"])((?:[^'"\\]|\\.)*)?\1''')
+    _RE_FALLBACK_VALUE = re.compile(r'''(['"])((?:[^'"\\]|\\.|["'][^"'])*)?\1''')
+
+    # Đánh giá PHP gốc: buffer mọi output, sau đó echo array được include dưới dạng JSON
+    _PHP_JSON_SCRIPT = (
+        'ob_start(); $data = include $argv[1]; ob_end_clean(); '
+        'echo json_encode($data, JSON_PRESERVE_ZERO_FRACTION | JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_SLASHES);'
+    )
+
+    # File lớn hơn ngưỡng này được memory-map thay vì đọc vào một bản sao bytes
+    _MMAP_THRESHOLD = 64 * 1024
+
+    # Output tiến độ: các dòng trạng thái của từng file được ghi ra stdout theo lô bằng số file này
+    _STATUS_FLUSH_INTERVAL = 256
+
+    # Validation: số key trong một file vượt quá mức này được coi là parse bị lỗi; file ngôn ngữ
+    # thực tế có thể vượt quá mười nghìn mục
+    _MAX_KEYS = 100000
+
+    # Parse cache: entry được key theo version này và backend parsing cùng với nội dung file
+    # - tăng version mỗi khi thay đổi parser làm đổi output, để kết quả cũ không bao giờ được dùng lại
+    _PARSER_VERSION = 4
+
+    # Tìm file: các thư mục không bao giờ đi vào - metadata VCS/tooling và log, cache, backup có
+    # timestamp của chính tool này (quét lại backup sẽ convert các bản sao)
+    _SKIP_DIR_NAMES = frozenset({".git", ".hg", ".svn", "node_modules", ".venv", "__pycache__", ".idea",
+                                 "conversion_logs", ".converter_cache"})
+    _RE_BACKUP_DIR = re.compile(r'backup_\d{8}_\d{6}')
+
+    # Tìm file: các tên không bao giờ được coi là file ngôn ngữ
+    _SKIP_FILE_NAMES = frozenset({"converter_en.py", "converter_vi.py", "load_json_example.php"})
+
+    # Định dạng dòng log dùng chung cho mọi log stream
+    _LOG_FORMATTER = _SecondCachedFormatter('[%(asctime)s] %(tag)s: %(message)s', '%Y-%m-%d %H:%M:%S')
+
+    # Log record được giữ trong bộ nhớ và ghi theo lô một lần mỗi file (hoặc khi tích lũy đủ số này)
+    _LOG_BUFFER_RECORDS = 256
+
     def __init__(self):
         self.root_dir = Path.cwd()
         self.php_files = []
@@ -34,13 +330,28 @@ class EnterprisePHPToJSONConverter:
         self.failed_files = []
         self.verified_files = []
         self.backup_dir = None
-        self.processing_delay = 0.1
-        self.max_retries = 3
+        self.processing_delay = 0.0
+        self.jobs = os.cpu_count() or 1
         self.integrity_check_enabled = True
+        self.verbose = False
+        self.compact_output = False
+        self.defer_backups = False
+        self.full_verification = False
+        self.parse_cache_enabled = True
+        self.cache_dir = self.root_dir / ".converter_cache"
+        # PHP CLI evaluation include, tức là thực thi, từng file - chỉ bật qua --php
+        self.php_bin = None
+        self.php_timeout = 5
 
         # Enterprise logging
         self.setup_enterprise_logging()
 
+    def __getstate__(self):
+        """Bỏ các log handler đang mở khi converter được gửi sang worker processes"""
+        state = self.__dict__.copy()
+        state['_loggers'] = {}
+        return state
+
     def setup_enterprise_logging(self):
         """Setup enterprise-grade logging system"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -50,19 +361,41 @@ class EnterprisePHPToJSONConverter:
         self.conversion_log = self.log_dir / f"conversion_{timestamp}.log"
         self.integrity_log = self.log_dir / f"integrity_{timestamp}.log"
         self.backup_log = self.log_dir / f"backup_{timestamp}.log"
+        self._loggers = {}
 
         print(f"📋 Enterprise logging đã bật:")
         print(f"   • Conversion log: {self.conversion_log.name}")
         print(f"   • Integrity log: {self.integrity_log.name}")
         print(f"   • Backup log: {self.backup_log.name}")
 
+    def _get_logger(self, log_file: Path) -> logging.Logger:
+        """Lấy logger có buffer cho log file, gắn file handler ở lần dùng đầu tiên"""
+        logger = self._loggers.get(log_file)
+        if logger is None:
+            logger = logging.getLogger(f"php2json.{log_file.stem}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            if not logger.handlers:
+                handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+                handler.setFormatter(self._LOG_FORMATTER)
+                logger.addHandler(logging.handlers.MemoryHandler(self._LOG_BUFFER_RECORDS, target=handler))
+            self._loggers[log_file] = logger
+        return logger
+
     def log_to_file(self, log_file: Path, level: str, message: str):
         """Ghi vào log file với timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {level}: {message}\n"
+        self._get_logger(log_file).info(message, extra={'tag': level})
 
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+    def flush_logs(self):
+        """Ghi các log record đang buffer ra file tương ứng"""
+        for logger in self._loggers.values():
+            for handler in logger.handlers:
+                handler.flush()
+
+    def _print_detail(self, message: str):
+        """Chỉ in chi tiết tiến trình từng file ở verbose mode"""
+        if self.verbose:
+            print(message)
 
     def create_backup_system(self):
         """Tạo enterprise backup system"""
@@ -75,7 +408,7 @@ class EnterprisePHPToJSONConverter:
 
         return self.backup_dir
 
-    def backup_file(self, php_file: Path) -> bool:
+    def backup_file(self, php_file: Path, content_bytes: Optional[bytes] = None, link: bool = False) -> bool:
         """Tạo backup của PHP file trước mọi thao tác"""
         try:
             if not self.backup_dir:
@@ -86,8 +419,26 @@ class EnterprisePHPToJSONConverter:
             backup_file = self.backup_dir / relative_path
             backup_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy file vào backup
-            shutil.copy2(php_file, backup_file)
+            # link chỉ được bật cho file sắp bị xóa: khi đó backup dùng chung inode với file gốc nên
+            # không copy byte nào, và việc xóa file gốc chỉ gỡ tên của nó - dữ liệu vẫn tồn tại thông
+            # qua link backup. Hardlink là alias của file, nên chỉnh sửa tại chỗ trên một file gốc được
+            # giữ lại sẽ làm đổi cả backup của nó; mọi backup khác đều là bản copy. Hardlink fallback
+            # về copy khi khác filesystem hoặc không được hỗ trợ.
+            linked = False
+            if link:
+                try:
+                    os.link(php_file, backup_file)
+                    linked = True
+                except OSError:
+                    pass
+
+            if not linked:
+                if content_bytes is None:
+                    shutil.copy2(php_file, backup_file)
+                else:
+                    # Ghi từ bytes đã có trong bộ nhớ thay vì đọc lại file nguồn
+                    backup_file.write_bytes(content_bytes)
+                    shutil.copystat(php_file, backup_file)
 
             self.log_to_file(self.backup_log, "SUCCESS", f"Backed up: {php_file} -> {backup_file}")
             return True
@@ -101,120 +452,390 @@ class EnterprisePHPToJSONConverter:
         self.php_files = []
 
         print("🔍 Enterprise scanning cho file PHP...")
-        for php_file in self.root_dir.rglob("*.php"):
-            if php_file.name in ["converter_en.py", "converter_vi.py", "load_json_example.php"]:
-                continue
+        # os.walk liệt kê mỗi thư mục một lần bằng scandir, nên kiểm tra JSON tồn tại chỉ là tra cứu set;
+        # các thư mục bị bỏ qua được prune tại chỗ và không bao giờ được liệt kê
+        skipped = 0
+        for dirpath, dirnames, filenames in os.walk(self.root_dir):
+            dirnames[:] = [d for d in dirnames
+                           if d not in self._SKIP_DIR_NAMES and not self._RE_BACKUP_DIR.fullmatch(d)]
+            names = set(filenames)
+            directory = None
+
+            for name in filenames:
+                if not name.endswith('.php') or name in self._SKIP_FILE_NAMES:
+                    continue
 
-            if skip_existing:
-                json_file = php_file.with_suffix('.json')
-                if json_file.exists():
-                    print(f"⏭️  Bỏ qua {php_file.relative_to(self.root_dir)} (JSON đã tồn tại)")
+                if skip_existing and name[:-4] + '.json' in names:
+                    skipped += 1
+                    if self.verbose:
+                        self._print_detail(f"⏭️  Bỏ qua {os.path.relpath(os.path.join(dirpath, name), self.root_dir)} (JSON đã tồn tại)")
                     continue
 
-            self.php_files.append(php_file)
+                if directory is None:
+                    directory = Path(dirpath)
+                self.php_files.append(directory / name)
 
+        if skipped and not self.verbose:
+            print(f"⏭️  Đã bỏ qua {skipped} file PHP (JSON đã tồn tại)")
         print(f"📊 Tìm thấy {len(self.php_files)} file PHP cho enterprise processing")
         self.log_to_file(self.conversion_log, "INFO", f"Found {len(self.php_files)} PHP files to process")
         return len(self.php_files)
 
-    def analyze_php_file(self, php_file: Path) -> Dict[str, Any]:
+    def prefetch_php_files(self):
+        """Yêu cầu kernel đọc trước mọi file PHP trong hàng đợi trong một lượt"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+
+        for php_file in self.php_files:
+            try:
+                fd = os.open(str(php_file), os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+    def read_php_bytes(self, php_file: Path):
+        """Đọc nội dung thô của file PHP; file lớn hơn ngưỡng mmap được map thay vì copy lên heap"""
+        with open(php_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= self._MMAP_THRESHOLD:
+                return f.read()
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def analyze_php_file(self, php_file: Path, content: Optional[str] = None, raw: Optional[bytes] = None) -> Dict[str, Any]:
         """Phân tích cấu trúc file PHP trước khi convert"""
         try:
-            with open(php_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                with open(php_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+            # Size và hash lấy từ raw bytes đã đọc, nên text không bị encode lại
+            if raw is None:
+                raw = content.encode('utf-8')
 
             analysis = {
-                'file_size': len(content),
-                'line_count': content.count('\n') + 1,
-                'has_php_tags': '<?php' in content or '<?=' in content,
-                'has_return_statement': re.search(r'\breturn\s+', content, re.IGNORECASE) is not None,
-                'has_variable_assignment': re.search(r'\$\w+\s*=', content) is not None,
+                'file_size': len(raw),
+                'line_count': None,
+                'has_php_tags': None,
+                'has_return_statement': None,
+                'has_variable_assignment': None,
                 'array_syntax': [],
                 'variable_names': [],
                 'encoding': 'utf-8',
-                'content_hash': hash(content)  # Cho integrity verification
+                'content_hash': hashlib.sha256(raw).hexdigest()  # Cho integrity verification
             }
 
-            # Phát hiện loại array syntax
-            if re.search(r'\[.*?\]', content, re.DOTALL):
-                analysis['array_syntax'].append('short_array')
-            if re.search(r'array\s*\(', content, re.IGNORECASE):
-                analysis['array_syntax'].append('long_array')
+            # Ngoài size và hash, mọi thông tin chỉ được báo cáo ở verbose mode - bỏ qua các lượt quét toàn file nếu không cần
+            if self.verbose:
+                # Số dòng và các cờ cấu trúc
+                analysis['line_count'] = content.count('\n') + 1
+                analysis['has_php_tags'] = '<?php' in content or '<?=' in content
+                analysis['has_return_statement'] = self._RE_RETURN_STMT.search(content) is not None
+                analysis['has_variable_assignment'] = self._RE_VAR_ASSIGN.search(content) is not None
+
+                # Phát hiện loại array syntax
+                found = {match.lastgroup for match in self._RE_ARRAY_SYNTAX.finditer(content)}
+                analysis['array_syntax'] = [syntax for syntax in ('short_array', 'long_array') if syntax in found]
 
-            # Trích xuất tên biến
-            var_matches = re.findall(r'\$(\w+)\s*=', content)
-            analysis['variable_names'] = list(set(var_matches))
+                # Trích xuất tên biến
+                analysis['variable_names'] = list(dict.fromkeys(self._RE_VAR_NAME.findall(content)))
 
             return analysis
 
         except Exception as e:
             return {'error': str(e)}
 
-    def parse_php_array_robust(self, content: str) -> Optional[Dict[str, Any]]:
+    def parse_php_array_robust(self, content: str, php_file: Optional[Path] = None) -> Optional[Dict[str, Any]]:
         """Parsing PHP đa chiến lược với fallbacks toàn diện"""
 
-        # Chiến lược 1: Advanced regex với hỗ trợ nested structure
-        result = self._parse_strategy_advanced_regex(content)
-        if result and len(result) > 0:
-            return result
+        # Native: để PHP interpreter đánh giá file khi đã được cài đặt
+        if self.php_bin and php_file is not None:
+            result = self._parse_with_php_cli(php_file)
+            if result and len(result) > 0:
+                return result
 
-        # Chiến lược 2: Tokenizer giống PHP
-        result = self._parse_strategy_tokenizer(content)
+        # Chính: tokenizer một lượt với recursive descent parsing
+        result = self._parse_php_tokens(content)
         if result and len(result) > 0:
             return result
 
+        # Mọi chiến lược fallback chỉ trả về các cặp 'key' => value, nên không có mũi tên
+        # thì không chiến lược nào thành công
+        if '=>' not in content:
+            return None
+
+        # Fallback cascade: làm sạch một lần, và chỉ thử các chiến lược dựa trên opener khi có opener
+        cleaned = self._clean_php_content(content)
+
+        if self._RE_ARRAY_PREAMBLE.search(cleaned):
+            # Chiến lược 1: Advanced regex với hỗ trợ nested structure
+            result = self._parse_strategy_advanced_regex(cleaned)
+            if result and len(result) > 0:
+                return result
+
+            # Chiến lược 2: Tokenizer giống PHP
+            result = self._parse_strategy_tokenizer(cleaned)
+            if result and len(result) > 0:
+                return result
+
         # Chiến lược 3: Line-by-line với state machine
-        result = self._parse_strategy_state_machine(content)
+        result = self._parse_strategy_state_machine(cleaned)
         if result and len(result) > 0:
             return result
 
         # Chiến lược 4: Regex với xử lý nested thủ công
-        result = self._parse_strategy_manual_nested(content)
+        result = self._parse_strategy_manual_nested(cleaned)
         if result and len(result) > 0:
             return result
 
         return None
 
+    def _parse_with_php_cli(self, php_file: Path) -> Optional[Dict[str, Any]]:
+        """Đánh giá file bằng PHP CLI và round-trip array qua json_encode"""
+        try:
+            proc = subprocess.run(
+                [self.php_bin, '-n', '-d', 'display_errors=stderr', '-r', self._PHP_JSON_SCRIPT, '--', str(php_file)],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=self.php_timeout
+            )
+            if proc.returncode != 0:
+                self._print_detail(f"   ⚠️  PHP CLI thất bại: exit code {proc.returncode}")
+                return None
+
+            data = self.decode_json_bytes(proc.stdout)
+            if isinstance(data, dict):
+                return data
+
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            self._print_detail(f"   ⚠️  PHP CLI thất bại: {e}")
+
+        return None
+
+    def _parse_php_tokens(self, content: str) -> Optional[Dict[str, Any]]:
+        """Parser chính: tokenize một lần, sau đó parse mảng bằng recursive descent"""
+        try:
+            tokens = self._tokenize_php(content)
+
+            for start in self._find_array_statements(tokens):
+                try:
+                    value, _ = self._parse_php_value(tokens, start)
+                except (ValueError, IndexError) as e:
+                    self._print_detail(f"   ⚠️  Parser chính thất bại: {e}")
+                    continue
+
+                if isinstance(value, dict) and value:
+                    return value
+
+        except Exception as e:
+            self._print_detail(f"   ⚠️  Parser chính thất bại: {e}")
+
+        return None
+
+    def _tokenize_php(self, content: str) -> List[Tuple[str, str]]:
+        """Tách PHP source thành các token (kind, text) trong một lượt"""
+        tokens = []
+        for match in self._RE_PHP_TOKEN.finditer(content):
+            kind = match.lastgroup
+            if kind != 'skip':
+                tokens.append((kind, match.group()))
+        return tokens
+
+    def _find_array_statements(self, tokens: List[Tuple[str, str]]) -> List[int]:
+        """Vị trí token của các mảng trong câu lệnh `return [...]` và `$var = [...]`"""
+        returns = []
+        assignments = []
+
+        for i, (kind, text) in enumerate(tokens):
+            if kind == 'name' and text.lower() == 'return':
+                if self._is_array_start(tokens, i + 1):
+                    returns.append(i + 1)
+            elif kind == 'variable' and tokens[i + 1:i + 2] == [('op', '=')]:
+                if self._is_array_start(tokens, i + 2):
+                    assignments.append(i + 2)
+
+        return returns + assignments
+
+    def _is_array_start(self, tokens: List[Tuple[str, str]], i: int) -> bool:
+        """Kiểm tra có array literal bắt đầu tại vị trí token i không"""
+        if i >= len(tokens):
+            return False
+        if tokens[i] == ('op', '['):
+            return True
+        return (tokens[i][0] == 'name' and tokens[i][1].lower() == 'array'
+                and tokens[i + 1:i + 2] == [('op', '(')])
+
+    def _parse_php_value(self, tokens: List[Tuple[str, str]], i: int) -> Tuple[Any, int]:
+        """Parse một giá trị PHP bắt đầu tại token i, trả về (value, vị trí tiếp theo)"""
+        kind, text = tokens[i]
+
+        if kind in ('string', 'heredoc'):
+            value = self._unescape_php_string(text) if kind == 'string' else self._decode_php_heredoc(text)
+            i += 1
+            # Nối chuỗi: 'a' . 'b'
+            while i < len(tokens) and tokens[i] == ('op', '.'):
+                part, i = self._parse_php_value(tokens, i + 1)
+                if isinstance(part, bool) or not isinstance(part, (str, int, float)):
+                    raise ValueError(f"Không thể nối {type(part).__name__} vào chuỗi")
+                value += str(part)
+            return value, i
+
+        if kind == 'number':
+            return self._php_number(text), i + 1
+
+        if kind == 'name':
+            lowered = text.lower()
+            if lowered in ('true', 'false'):
+                return lowered == 'true', i + 1
+            if lowered == 'null':
+                return None, i + 1
+            if lowered == 'array' and tokens[i + 1] == ('op', '('):
+                return self._parse_php_array(tokens, i + 2, ')')
+
+        if tokens[i] == ('op', '['):
+            return self._parse_php_array(tokens, i + 1, ']')
+
+        raise ValueError(f"Giá trị PHP không được hỗ trợ {text!r}")
+
+    def _php_number(self, literal: str) -> Any:
+        """Chuyển literal số PHP thành int hoặc float theo quy tắc của PHP"""
+        sign = -1 if literal.startswith('-') else 1
+        digits = literal.lstrip('-').replace('_', '')
+        prefix = digits[:2].lower()
+
+        if prefix in ('0x', '0b', '0o'):
+            value = int(digits[2:], {'0x': 16, '0b': 2, '0o': 8}[prefix])
+        elif '.' in digits or 'e' in digits or 'E' in digits:
+            return sign * float(digits)
+        elif digits.startswith('0'):
+            # Số 0 đứng đầu là literal octal, như trong PHP; chữ số 8 và 9 cũng là lỗi parse ở đó
+            value = int(digits, 8)
+        else:
+            value = int(digits)
+
+        # Số nguyên vượt quá PHP_INT_MAX trở thành float
+        return sign * (value if value <= self._PHP_INT_MAX else float(value))
+
+    def _parse_php_array(self, tokens: List[Tuple[str, str]], i: int, closer: str) -> Tuple[Any, int]:
+        """Parse các phần tử mảng đến dấu đóng ngoặc, trả về (dict hoặc list, vị trí tiếp theo)"""
+        entries = []
+
+        while tokens[i] != ('op', closer):
+            value, i = self._parse_php_value(tokens, i)
+
+            if tokens[i][0] == 'arrow':
+                key = value
+                if isinstance(key, (dict, list)):
+                    raise ValueError("Array key không hợp lệ")
+                value, i = self._parse_php_value(tokens, i + 1)
+                entries.append((True, key, value))
+            else:
+                entries.append((False, None, value))
+
+            if tokens[i] == ('op', ','):
+                i += 1
+            elif tokens[i] != ('op', closer):
+                raise ValueError(f"Cần ',' hoặc '{closer}' nhưng gặp {tokens[i][1]!r}")
+
+        return self._build_php_array(entries), i + 1
+
+    def _build_php_array(self, entries: List[Tuple[bool, Any, Any]]) -> Any:
+        """Áp dụng quy tắc key của PHP; key tuần tự 0..n-1 thành list giống json_encode"""
+        result = {}
+        next_index = 0
+
+        for has_key, key, value in entries:
+            if not has_key:
+                key = next_index
+            elif key is None:
+                key = ''
+            elif isinstance(key, (bool, float)):
+                key = int(key)
+            elif isinstance(key, str) and self._RE_PHP_INT_KEY.fullmatch(key):
+                key = int(key)
+
+            if isinstance(key, int) and key >= next_index:
+                next_index = key + 1
+            result[key] = value
+
+        if list(result) == list(range(len(result))):
+            return list(result.values())
+
+        # Key được intern: các file dịch lặp lại cùng các key, nên mỗi key khác nhau chỉ lưu một lần mỗi process
+        return {sys.intern(str(key)): value for key, value in result.items()}
+
+    def _unescape_php_string(self, literal: str) -> str:
+        """Giải mã PHP string literal theo quy tắc escape của PHP"""
+        quote, body = literal[0], literal[1:-1]
+
+        if '\\' not in body:
+            return body
+        if quote == "'":
+            return self._RE_SQ_ESCAPE.sub(r'\1', body)
+        return self._decode_dq_escapes(body, self._RE_DQ_ESCAPE)
+
+    def _decode_php_heredoc(self, literal: str) -> str:
+        """Giải mã literal heredoc/nowdoc, loại bỏ phần thụt lề của marker đóng khỏi mỗi dòng"""
+        match = self._RE_PHP_TOKEN.match(literal)
+        body = match.group('hd_body') or ''
+        indent = match.group('hd_indent')
+
+        if indent:
+            body = '\n'.join(line[len(indent):] if line.startswith(indent) else line.lstrip(' \t')
+                              for line in body.split('\n'))
+        if match.group('hd_quote') == "'":
+            return body
+        return self._decode_dq_escapes(body, self._RE_HEREDOC_ESCAPE)
+
+    def _decode_dq_escapes(self, body: str, pattern: Pattern) -> str:
+        """Giải mã escape của chuỗi ngoặc kép / heredoc; escape octal và hex là bytes thô, như trong PHP"""
+        decoded = pattern.sub(self._replace_dq_escape, body)
+        # Bytes trên 0x7f được giữ dưới dạng surrogate escape, rồi encode lại cùng phần text xung quanh
+        # và decode theo UTF-8, nên chuỗi như "\xC3\xA9" trở thành một ký tự
+        return decoded.encode('utf-8', 'surrogateescape').decode('utf-8', 'surrogateescape')
+
+    def _replace_dq_escape(self, match) -> str:
+        """Callback thay thế cho escape sequences trong chuỗi ngoặc kép"""
+        simple, octal, hex_code, codepoint = match.groups()
+
+        if simple:
+            return self._PHP_DQ_ESCAPES[simple]
+        if codepoint:
+            return chr(int(codepoint, 16))
+
+        # Escape octal và hex là từng byte, không phải code point
+        byte = int(octal, 8) & 0xFF if octal else int(hex_code, 16)
+        return chr(byte) if byte < 0x80 else chr(0xDC00 + byte)
+
     def _parse_strategy_advanced_regex(self, content: str) -> Optional[Dict[str, Any]]:
         """Chiến lược 1: Regex nâng cao với xử lý toàn diện dấu ngoặc kép"""
         try:
-            # Làm sạch PHP content trước
-            content = self._clean_php_content(content)
-
-            # Tìm PHP array patterns với tính linh hoạt cao hơn
-            patterns = [
-                r'return\s*\[\s*(.*?)\s*\];',
-                r'return\s*array\s*\(\s*(.*?)\s*\);',
-                r'\$(?:lang|language|data|translations|messages|text|strings)\s*=\s*\[\s*(.*?)\s*\];',
-                r'\$(?:lang|language|data|translations|messages|text|strings)\s*=\s*array\s*\(\s*(.*?)\s*\);'
-            ]
-
-            array_content = None
-            for pattern in patterns:
-                match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-                if match:
-                    array_content = match.group(1)
+            # Quét content một lượt; giữ body đầu tiên của mỗi dạng khai báo
+            bodies = {}
+            for match in self._RE_ARRAY_BODY.finditer(content):
+                bodies.setdefault(match.lastgroup, match.group(match.lastgroup))
+                if match.lastgroup == self._ARRAY_BODY_PRIORITY[0]:
                     break
 
+            array_content = next((bodies[form] for form in self._ARRAY_BODY_PRIORITY if form in bodies), None)
+
             if not array_content:
                 return None
 
             return self._parse_array_content_advanced(array_content)
 
         except Exception as e:
-            print(f"   ⚠️  Chiến lược 1 thất bại: {e}")
+            self._print_detail(f"   ⚠️  Chiến lược 1 thất bại: {e}")
 
         return None
 
     def _parse_strategy_tokenizer(self, content: str) -> Optional[Dict[str, Any]]:
         """Chiến lược 2: Tokenizer approach"""
         try:
-            content = self._clean_php_content(content)
             result = {}
 
             array_start = None
-            for pattern in [r'return\s*\[', r'return\s*array\s*\(', r'\$\w+\s*=\s*\[', r'\$\w+\s*=\s*array\s*\(']:
-                match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in self._RE_ARRAY_START_PATTERNS:
+                match = pattern.search(content)
                 if match:
                     array_start = match.end()
                     break
@@ -224,22 +845,7 @@ class EnterprisePHPToJSONConverter:
 
             remaining_content = content[array_start:]
 
-            kv_pattern = r"""
-                (?:^|,|\n)\s*                    # Bắt đầu hoặc separator
-                (['\"])((?:\\.|(?!\1)[^\\])*?)\1  # Quoted key
-                \s*=>\s*                         # Mũi tên
-                (?:
-                    (['\"])((?:\\.|(?!\3)[^\\])*?)\3  # Quoted value
-                    |
-                    (\d+(?:\.\d+)?)              # Số
-                    |
-                    (true|false|null)            # Boolean/null
-                    |
-                    (\[(?:[^\[\]]|(?7))*\])      # Simple nested array
-                )
-            """
-
-            matches = re.finditer(kv_pattern, remaining_content, re.VERBOSE | re.DOTALL | re.IGNORECASE)
+            matches = self._RE_KV_TOKENIZER.finditer(remaining_content)
 
             for match in matches:
                 groups = match.groups()
@@ -262,14 +868,13 @@ class EnterprisePHPToJSONConverter:
             return result if result else None
 
         except Exception as e:
-            print(f"   ⚠️  Chiến lược 2 thất bại: {e}")
+            self._print_detail(f"   ⚠️  Chiến lược 2 thất bại: {e}")
 
         return None
 
     def _parse_strategy_state_machine(self, content: str) -> Optional[Dict[str, Any]]:
         """Chiến lược 3: State machine line-by-line parsing"""
         try:
-            content = self._clean_php_content(content)
             lines = content.split('\n')
             result = {}
 
@@ -283,7 +888,7 @@ class EnterprisePHPToJSONConverter:
                 if not line or line.startswith('//') or line.startswith('/*'):
                     continue
 
-                if not in_array and ('=>' in line or re.search(r'return\s*[\[\(]|^\$\w+\s*=\s*[\[\(]', line)):
+                if not in_array and ('=>' in line or self._RE_ARRAY_OPENER_LINE.search(line)):
                     in_array = True
 
                 if not in_array:
@@ -295,11 +900,11 @@ class EnterprisePHPToJSONConverter:
                         key_part = parts[0].strip()
                         value_part = parts[1].strip()
 
-                        key_match = re.search(r"['\"]([^'\"]*)['\"]", key_part)
+                        key_match = self._RE_QUOTED_SIMPLE.search(key_part)
                         if key_match:
                             current_key = self._clean_string_value(key_match.group(1))
 
-                            value_match = re.search(r"['\"]([^'\"]*)['\"]", value_part)
+                            value_match = self._RE_QUOTED_SIMPLE.search(value_part)
                             if value_match:
                                 result[current_key] = self._clean_string_value(value_match.group(1))
                                 current_key = None
@@ -309,31 +914,16 @@ class EnterprisePHPToJSONConverter:
             return result if result else None
 
         except Exception as e:
-            print(f"   ⚠️  Chiến lược 3 thất bại: {e}")
+            self._print_detail(f"   ⚠️  Chiến lược 3 thất bại: {e}")
 
         return None
 
     def _parse_strategy_manual_nested(self, content: str) -> Optional[Dict[str, Any]]:
         """Chiến lược 4: Xử lý nested structure thủ công"""
         try:
-            content = self._clean_php_content(content)
             result = {}
 
-            pattern = r"""
-                (['\"])((?:\\.|(?!\1)[^\\])*?)\1    # Key trong quotes
-                \s*=>\s*                            # Mũi tên
-                (?:
-                    (['\"])((?:\\.|(?!\3)[^\\])*?)\3 # Simple quoted value
-                    |
-                    (\d+(?:\.\d+)?)                 # Numeric value
-                    |
-                    (true|false|null)               # Boolean/null
-                    |
-                    (\[(?:[^\[\]]++|(?7))*+\])      # Nested array (possessive)
-                )
-            """
-
-            matches = re.finditer(pattern, content, re.VERBOSE | re.DOTALL | re.IGNORECASE)
+            matches = self._RE_KV_MANUAL.finditer(content)
 
             for match in matches:
                 try:
@@ -355,73 +945,22 @@ class EnterprisePHPToJSONConverter:
                     result[clean_key] = clean_value
 
                 except Exception as e:
-                    print(f"   ⚠️  Lỗi parsing match: {e}")
+                    self._print_detail(f"   ⚠️  Lỗi parsing match: {e}")
                     continue
 
             return result if result else None
 
         except Exception as e:
-            print(f"   ⚠️  Chiến lược 4 thất bại: {e}")
+            self._print_detail(f"   ⚠️  Chiến lược 4 thất bại: {e}")
 
         return None
 
     def _clean_php_content(self, content: str) -> str:
         """Làm sạch PHP content để parsing"""
-        content = re.sub(r'<\?php\s*', '', content)
-        content = re.sub(r'\?>', '', content)
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-        content = re.sub(r'#.*?$', '', content, flags=re.MULTILINE)
-
-        return content.strip()
-
-    def _clean_string_value(self, value: str) -> str:
-        """Làm sạch giá trị chuỗi với xử lý nâng cao các dấu ngoặc kép"""
-        if not value:
-            return value
-
-        # Bước 1: Xử lý PHP escape sequences trước
-        value = value.replace('\\\\', '\x00BACKSLASH\x00')  # Placeholder tạm thời
-        value = value.replace('\\"', '"')
-        value = value.replace("\\'", "'")
-        value = value.replace('\\n', '\n')
-        value = value.replace('\\r', '\r')
-        value = value.replace('\\t', '\t')
-        value = value.replace('\x00BACKSLASH\x00', '\\')  # Khôi phục backslashes
-
-        # Bước 2: Loại bỏ dấu ngoặc bao quanh nếu bị lặp
-        value = value.strip()
-        if (value.startswith('""') and value.endswith('""') and len(value) > 4):
-            value = value[2:-2]
-        elif (value.startswith("''") and value.endswith("''") and len(value) > 4):
-            value = value[2:-2]
-
-        # Bước 3: Sửa các vấn đề nested quotes
-        # Loại bỏ dấu ngoặc thừa xung quanh HTML content
-        value = re.sub(r'"\s*<([^>]+)>\s*"', r'<\1>', value)
-        value = re.sub(r'"\s*</([^>]+)>\s*"', r'</\1>', value)
-
-        # Bước 4: Làm sạch các pattern dấu ngoặc không cần thiết
-        # Loại bỏ dấu ngoặc xung quanh từ đơn không cần
-        value = re.sub(r'\b"(\w+)"\b', r'\1', value)
-
-        # Bước 5: Sửa các pattern dấu ngoặc bị lặp
-        value = re.sub(r'""([^"]*?)""', r'"\1"', value)
-        value = re.sub(r"''([^']*?)''", r"'\1'", value)
-
-        # Bước 6: Làm sạch dấu ngoặc thừa trong HTML attributes
-        value = re.sub(r'([a-zA-Z-]+)=""([^"]*?)""', r'\1="\2"', value)
-
-        # Bước 7: Loại bỏ dấu ngoặc xuất hiện không đúng chỗ
-        value = re.sub(r'(\w)\s*"\s*(\w)', r'\1 \2', value)
-        value = re.sub(r'(\w)\s*\'\s*(\w)', r'\1 \2', value)
-
-        # Bước 8: Làm sạch cuối cùng - loại bỏ dấu ngoặc kép thừa
-        # Tìm các pattern như: word"word hoặc word'word
-        value = re.sub(r'(\w)"(\w)', r'\1\2', value)
-        value = re.sub(r"(\w)'(\w)", r'\1\2', value)
+        return self._RE_PHP_NOISE.sub(r'\g<string>', content).strip()
 
-        return value
+    # Làm sạch string value ở fallback (memoize, mức module)
+    _clean_string_value = staticmethod(_clean_string_value)
 
     def _parse_nested_array(self, nested_content: str) -> Optional[str]:
         """Parse nested array content"""
@@ -433,57 +972,32 @@ class EnterprisePHPToJSONConverter:
 
     def _parse_array_content_advanced(self, content: str) -> Dict[str, Any]:
         """Phân tích nội dung mảng nâng cao với xử lý dấu ngoặc tốt hơn"""
-        result = {}
-
-        # Pattern regex nâng cao cho key-value pairs với xử lý nested quotes đúng cách
-        # Pattern này xử lý nested quotes bằng cách sử dụng non-greedy matching và escaping đúng
-        kv_pattern = r'''
-            (?:^|,|\n)\s*                           # Bắt đầu hoặc dấu phân cách với khoảng trắng
-            ([\'"])((?:\\.|(?!\1)[^\\])*?)\1        # Key có dấu ngoặc với xử lý escape
-            \s*=>\s*                                # Mũi tên với khoảng trắng tùy chọn
-            ([\'"])((?:\\.|[^\\])*?)\3              # Giá trị chuỗi có dấu ngoặc với xử lý tốt hơn
-            (?=\s*(?:,|\n|$|\]))                    # Lookahead cho kết thúc
-        '''
-
-        # Pattern thay thế cho nested quotes phức tạp hơn
-        kv_pattern_alt = r'''
-            (?:^|,|\n)\s*                           # Bắt đầu hoặc dấu phân cách
-            ([\'"])((?:[^\'"]|\\[\'"])*?)\1         # Key với escaped quotes
-            \s*=>\s*                                # Mũi tên
-            ([\'"])                                 # Dấu ngoặc mở của value
-            ((?:                                    # Nội dung value
-                [^\'\"\\]|                          # Ký tự bình thường
-                \\.|                                # Ký tự escaped
-                [\'"](?![\'"])                      # Dấu ngoặc đơn không ở boundary
-            )*?)
-            \3                                      # Dấu ngoặc đóng của value
-            (?=\s*(?:,|\n|$|\]))                    # Boundary kết thúc
-        '''
-
         # Thử pattern thay thế trước để xử lý nested quotes tốt hơn
-        matches = list(re.finditer(kv_pattern_alt, content, re.VERBOSE | re.DOTALL | re.IGNORECASE))
+        matches = list(self._RE_KV_ADVANCED_ALT.finditer(content))
 
         if not matches:
             # Fallback sang pattern đơn giản hơn
-            matches = list(re.finditer(kv_pattern, content, re.VERBOSE | re.DOTALL | re.IGNORECASE))
-
+            matches = list(self._RE_KV_ADVANCED.finditer(content))
+
+        # Thu thập các cặp và dựng dict trong một lần gọi sau khi đã làm sạch mọi match; vòng
+        # lặp chỉ dùng biến local
+        pairs = []
+        append = pairs.append
+        clean = self._clean_string_value
+        intern = sys.intern
         for match in matches:
-            groups = match.groups()
-
-            if len(groups) >= 4:
-                # Trích xuất key
-                key = self._clean_string_value(groups[1]) if groups[1] else None
+            # Cả hai pattern capture (quote của key, key, quote của value, value); match không có key bị bỏ qua
+            _, raw_key, _, raw_value = match.groups()
+            if not raw_key:
+                continue
 
-                # Trích xuất value - sử dụng group dài hơn (nội dung được capture nhiều hơn)
-                if len(groups) >= 4 and groups[3]:
-                    value = self._clean_string_value(groups[3])
-                elif len(groups) >= 2 and groups[1]:
-                    value = self._clean_string_value(groups[1])
-                else:
-                    continue
+            key = clean(raw_key)
+            if key:
+                key = intern(key)
+                # Value rỗng dùng lại nội dung key
+                append((key, clean(raw_value) if raw_value else key))
 
-                if key:
-                    result[key] = value
+        result = dict(pairs)
 
         # Nếu vẫn không có kết quả, thử parsing từng dòng như fallback
         if not result:
@@ -494,100 +1008,86 @@ class EnterprisePHPToJSONConverter:
     def _parse_line_by_line_fallback(self, content: str) -> Dict[str, Any]:
         """Fallback parsing từng dòng cho các trường hợp dấu ngoặc phức tạp"""
         result = {}
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('//') or line.startswith('#'):
+        # Bind một lần, bên ngoài vòng lặp từng dòng
+        clean = self._clean_string_value
+        search_key = self._RE_FALLBACK_KEY.search
+        search_value = self._RE_FALLBACK_VALUE.search
+
+        for line_match in self._RE_FALLBACK_LINE.finditer(content):
+            line = line_match.group().strip()
+            if line.startswith(('//', '#')):
                 continue
 
-            # Tìm pattern key => value
-            if '=>' in line:
-                parts = line.split('=>', 1)
-                if len(parts) == 2:
-                    key_part = parts[0].strip()
-                    value_part = parts[1].strip()
-
-                    # Loại bỏ dấu phẩy cuối
-                    if value_part.endswith(','):
-                        value_part = value_part[:-1].strip()
-
-                    # Trích xuất key
-                    key_match = re.search(r'''(['"])((?:[^'"\\]|\\.)*)?\1''', key_part)
-                    if key_match:
-                        key = self._clean_string_value(key_match.group(2) or '')
-
-                        # Trích xuất value - xử lý toàn bộ chuỗi có dấu ngoặc
-                        value_match = re.search(r'''(['"])((?:[^'"\\]|\\.|["'][^"'])*)?\1''', value_part)
-                        if value_match:
-                            value = self._clean_string_value(value_match.group(2) or '')
-                            if key:
-                                result[key] = value
+            key_part, _, value_part = line.partition('=>')
+            key_part = key_part.strip()
+            value_part = value_part.strip()
 
-        return result
+            # Loại bỏ dấu phẩy cuối
+            if value_part.endswith(','):
+                value_part = value_part[:-1].strip()
 
-    def _smart_split_array_entries(self, content: str) -> List[str]:
-        """Smart split tôn trọng quotes và nested structures"""
-        entries = []
-        current_entry = ""
-        in_quotes = False
-        quote_char = None
-        bracket_depth = 0
-
-        i = 0
-        while i < len(content):
-            char = content[i]
-
-            if char in ['"', "'"] and (i == 0 or content[i-1] != '\\'):
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-
-            elif not in_quotes:
-                if char in ['[', '(']:
-                    bracket_depth += 1
-                elif char in [']', ')']:
-                    bracket_depth -= 1
-                elif char == ',' and bracket_depth == 0:
-                    entries.append(current_entry)
-                    current_entry = ""
-                    i += 1
-                    continue
+            # Trích xuất key
+            key_match = search_key(key_part)
+            if key_match:
+                key = clean(key_match.group(2) or '')
 
-            current_entry += char
-            i += 1
+                # Trích xuất value - xử lý toàn bộ chuỗi có dấu ngoặc
+                value_match = search_value(value_part)
+                if value_match:
+                    value = clean(value_match.group(2) or '')
+                    if key:
+                        result[key] = value
 
-        if current_entry.strip():
-            entries.append(current_entry)
+        return result
 
-        return entries
+    def encode_json_output(self, data: Dict[str, Any]) -> bytes:
+        """Serialize dữ liệu thành JSON bytes UTF-8 trong một lượt - có indent, hoặc thu gọn khi bật compact output"""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS if self.compact_output else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            try:
+                return orjson.dumps(data, option=option)
+            except TypeError:
+                pass
+        if self.compact_output:
+            return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def decode_json_bytes(self, payload: bytes) -> Any:
+        """Parse JSON bytes UTF-8, qua orjson khi đã cài; mọi thứ orjson từ chối được thử lại bằng stdlib json"""
+        if orjson is not None:
+            try:
+                return orjson.loads(payload)
+            except ValueError:
+                pass
+        return json.loads(payload.decode('utf-8'))
+
+    def write_file_bytes(self, path: Path, payload: bytes):
+        """Ghi bytes vào file bằng các lệnh os.write thô, bỏ qua lớp buffered I/O của Python"""
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
     def validate_json_output(self, data: Dict[str, Any]) -> Tuple[bool, str]:
         """Validate JSON output trước khi lưu"""
-        try:
-            if not data:
-                return False, "Dữ liệu rỗng"
-
-            if not isinstance(data, dict):
-                return False, "Dữ liệu không phải dictionary"
+        if not data:
+            return False, "Dữ liệu rỗng"
 
-            if len(data) == 0:
-                return False, "Không tìm thấy keys"
+        if not isinstance(data, dict):
+            return False, "Dữ liệu không phải dictionary"
 
-            if len(data) > 10000:
-                return False, f"Quá nhiều keys ({len(data)}), có thể lỗi parsing"
+        if len(data) == 0:
+            return False, "Không tìm thấy keys"
 
-            json.dumps(data, ensure_ascii=False, indent=2)
+        if len(data) > self._MAX_KEYS:
+            return False, f"Quá nhiều keys ({len(data)}), có thể lỗi parsing"
 
-            return True, f"Hợp lệ với {len(data)} keys"
+        return True, f"Hợp lệ với {len(data)} keys"
 
-        except Exception as e:
-            return False, f"JSON validation thất bại: {e}"
-
-    def verify_data_integrity(self, php_file: Path, json_file: Path, original_data: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
+    def verify_data_integrity(self, php_file: Path, json_file: Path, original_data: Dict[str, Any], payload: Optional[bytes] = None) -> Tuple[bool, str, Dict[str, Any]]:
         """Enterprise-grade data integrity verification"""
         integrity_report = {
             'php_file': str(php_file),
@@ -597,81 +1097,98 @@ class EnterprisePHPToJSONConverter:
             'issues_found': [],
             'data_match': False,
             'key_count_match': False,
-            'content_hash_match': False
+            'content_hash_match': False,
+            'content_hash': None
         }
 
         try:
-            print(f"      🔍 Kiểm tra tính toàn vẹn dữ liệu...")
+            self._print_detail(f"      🔍 Kiểm tra tính toàn vẹn dữ liệu...")
 
             # Kiểm tra 1: JSON file tồn tại và đọc được
             if not json_file.exists():
                 integrity_report['issues_found'].append("JSON file không tồn tại")
                 return False, "JSON file bị thiếu", integrity_report
 
-            with open(json_file, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            with open(json_file, 'rb') as f:
+                json_bytes = f.read()
             integrity_report['checks_performed'].append("JSON file readability")
 
-            # Kiểm tra 2: So sánh số lượng key
-            original_key_count = len(original_data)
-            json_key_count = len(json_data)
+            # Kiểm tra 2: Content verification - bytes trên đĩa phải khớp với payload đã encode
+            if payload is None:
+                payload = self.encode_json_output(original_data)
 
-            if original_key_count != json_key_count:
-                integrity_report['issues_found'].append(f"Số key không khớp: PHP={original_key_count}, JSON={json_key_count}")
-            else:
-                integrity_report['key_count_match'] = True
-            integrity_report['checks_performed'].append("Key count comparison")
-
-            # Kiểm tra 3: Deep key-value comparison
-            missing_keys = []
-            value_mismatches = []
-
-            for key, php_value in original_data.items():
-                if key not in json_data:
-                    missing_keys.append(key)
-                elif str(json_data[key]) != str(php_value):
-                    value_mismatches.append({
-                        'key': key,
-                        'php_value': php_value,
-                        'json_value': json_data[key]
-                    })
-
-            # Kiểm tra key thừa trong JSON
-            extra_keys = [key for key in json_data.keys() if key not in original_data]
-
-            if missing_keys:
-                integrity_report['issues_found'].append(f"Key thiếu trong JSON: {missing_keys}")
-            if extra_keys:
-                integrity_report['issues_found'].append(f"Key thừa trong JSON: {extra_keys}")
-            if value_mismatches:
-                integrity_report['issues_found'].append(f"Value không khớp: {len(value_mismatches)} phát hiện")
-
-            integrity_report['checks_performed'].append("Deep key-value comparison")
-
-            # Kiểm tra 4: Content hash verification
-            json_content_hash = hash(json.dumps(json_data, sort_keys=True))
-            php_content_hash = hash(json.dumps(original_data, sort_keys=True))
-
-            if json_content_hash == php_content_hash:
-                integrity_report['content_hash_match'] = True
+            content_hash_match = json_bytes == payload
+            integrity_report['content_hash'] = hashlib.sha256(json_bytes).hexdigest()
+            integrity_report['content_hash_match'] = content_hash_match
             integrity_report['checks_performed'].append("Content hash verification")
 
-            # Đánh giá cuối cùng
-            data_integrity_passed = (
-                integrity_report['key_count_match'] and
-                len(missing_keys) == 0 and
-                len(extra_keys) == 0 and
-                len(value_mismatches) == 0
-            )
+            if content_hash_match and not self.full_verification:
+                # File chứa đúng các bytes đã encode từ original_data, decode lại chỉ kiểm tra lại
+                # encoder; --full-verify bật lại phép so sánh sâu
+                integrity_report['key_count_match'] = True
+                data_integrity_passed = True
+            else:
+                json_data = self.decode_json_bytes(json_bytes)
+                # Fast path: một phép so sánh dict ở mức C giải quyết trường hợp khớp hoàn toàn phổ biến
+                data_integrity_passed = json_data == original_data
+                integrity_report['checks_performed'].append("Direct equality comparison")
 
+                if data_integrity_passed:
+                    integrity_report['key_count_match'] = True
+                else:
+                    # Không khớp: tạo báo cáo diff chi tiết
+                    # Kiểm tra 3: So sánh số lượng key
+                    original_key_count = len(original_data)
+                    json_key_count = len(json_data)
+
+                    if original_key_count != json_key_count:
+                        integrity_report['issues_found'].append(f"Số key không khớp: PHP={original_key_count}, JSON={json_key_count}")
+                    else:
+                        integrity_report['key_count_match'] = True
+                    integrity_report['checks_performed'].append("Key count comparison")
+
+                    # Kiểm tra 4: Deep key-value comparison
+                    missing_keys = []
+                    value_mismatches = []
+
+                    for key, php_value in original_data.items():
+                        if key not in json_data:
+                            missing_keys.append(key)
+                        elif str(json_data[key]) != str(php_value):
+                            value_mismatches.append({
+                                'key': key,
+                                'php_value': php_value,
+                                'json_value': json_data[key]
+                            })
+
+                    # Kiểm tra key thừa trong JSON
+                    extra_keys = [key for key in json_data.keys() if key not in original_data]
+
+                    if missing_keys:
+                        integrity_report['issues_found'].append(f"Key thiếu trong JSON: {missing_keys}")
+                    if extra_keys:
+                        integrity_report['issues_found'].append(f"Key thừa trong JSON: {extra_keys}")
+                    if value_mismatches:
+                        integrity_report['issues_found'].append(f"Value không khớp: {len(value_mismatches)} phát hiện")
+
+                    integrity_report['checks_performed'].append("Deep key-value comparison")
+
+                    data_integrity_passed = (
+                        integrity_report['key_count_match'] and
+                        len(missing_keys) == 0 and
+                        len(extra_keys) == 0 and
+                        len(value_mismatches) == 0
+                    )
+
+            # Đánh giá cuối cùng
             integrity_report['data_match'] = data_integrity_passed
 
             if data_integrity_passed:
-                print(f"      ✅ Tính toàn vẹn dữ liệu xác minh: 100% khớp")
+                self._print_detail(f"      ✅ Tính toàn vẹn dữ liệu xác minh: 100% khớp")
                 self.log_to_file(self.integrity_log, "SUCCESS", f"Data integrity verified for {php_file}")
                 return True, "Tính toàn vẹn dữ liệu được xác minh", integrity_report
             else:
-                print(f"      ❌ Phát hiện vấn đề tính toàn vẹn: {len(integrity_report['issues_found'])} vấn đề")
+                self._print_detail(f"      ❌ Phát hiện vấn đề tính toàn vẹn: {len(integrity_report['issues_found'])} vấn đề")
                 self.log_to_file(self.integrity_log, "FAILED", f"Data integrity issues for {php_file}: {integrity_report['issues_found']}")
                 return False, f"Tính toàn vẹn thất bại: {len(integrity_report['issues_found'])} vấn đề", integrity_report
 
@@ -680,29 +1197,63 @@ class EnterprisePHPToJSONConverter:
             self.log_to_file(self.integrity_log, "ERROR", f"Data integrity verification error for {php_file}: {e}")
             return False, f"Lỗi verification: {str(e)}", integrity_report
 
-    def auto_retry_conversion(self, php_file: Path, max_retries: int = 3) -> Tuple[bool, str, Dict[str, Any], Dict[str, Any]]:
-        """Cơ chế auto-retry cho conversions thất bại"""
-        for attempt in range(1, max_retries + 1):
-            print(f"      🔄 Lần thử conversion {attempt}/{max_retries}")
+    def _parse_cache_key(self, content_hash: str) -> str:
+        """Tên file cache cho nội dung này theo parser version và backend hiện tại"""
+        backend = 'php' if self.php_bin else 'python'
+        return hashlib.sha256(f"{self._PARSER_VERSION}:{backend}:{content_hash}".encode('ascii')).hexdigest()
 
-            try:
+    def load_cached_parse(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Trả về dữ liệu đã verify trước đó cho nội dung file giống hệt, nếu có trong cache"""
+        if not self.parse_cache_enabled:
+            return None
+
+        try:
+            with open(self.cache_dir / f"{self._parse_cache_key(content_hash)}.json", 'rb') as f:
+                data = self.decode_json_bytes(f.read())
+        except (OSError, ValueError):
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    def store_cached_parse(self, content_hash: str, payload: bytes):
+        """Lưu JSON output đã verify cho nội dung file này"""
+        if not self.parse_cache_enabled:
+            return
+
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            cache_key = self._parse_cache_key(content_hash)
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            # Ghi rồi đổi tên, để các worker chạy đồng thời không bao giờ thấy entry dở dang
+            tmp_file = self.cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+            self.write_file_bytes(tmp_file, payload)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.log_to_file(self.conversion_log, "WARNING", f"Parse cache write failed: {e}")
+
+    def parse_and_validate(self, php_file: Path, content: Optional[str] = None) -> Tuple[bool, str, Dict[str, Any]]:
+        """Parse PHP content và validate mảng kết quả"""
+        # Parsing là tất định với cùng nội dung, nên lỗi được báo ngay thay vì retry
+        try:
+            if content is None:
                 with open(php_file, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                data = self.parse_php_array_robust(content)
-
-                if data is not None:
-                    is_valid, validation_msg = self.validate_json_output(data)
-                    if is_valid:
-                        return True, validation_msg, data, {'attempts': attempt}
+            data = self.parse_php_array_robust(content, php_file)
 
-                print(f"      ⚠️  Lần thử {attempt} thất bại, đang retry...")
-                time.sleep(0.2 * attempt)  # Progressive delay
+        except Exception as e:
+            self._print_detail(f"      ❌ Lỗi conversion: {e}")
+            return False, f"Lỗi conversion: {e}", {}
 
-            except Exception as e:
-                print(f"      ❌ Lần thử {attempt} lỗi: {e}")
+        if data is None:
+            message = "Không parse được PHP array nào"
+        else:
+            is_valid, message = self.validate_json_output(data)
+            if is_valid:
+                return True, message, data
 
-        return False, f"Tất cả {max_retries} lần thử conversion đều thất bại", {}, {'attempts': max_retries}
+        self._print_detail(f"      ⚠️  Conversion thất bại: {message}")
+        return False, f"Conversion thất bại: {message}", {}
 
     def convert_file_enterprise(self, php_file: Path) -> Tuple[bool, str, Dict[str, Any]]:
         """Enterprise-grade file conversion với full integrity checking"""
@@ -712,37 +1263,51 @@ class EnterprisePHPToJSONConverter:
             'strategies_tried': [],
             'validation': {},
             'integrity': {},
-            'backup_created': False,
-            'retry_attempts': 0
+            'backup_created': False
         }
 
         try:
-            print(f"   📁 Enterprise processing: {php_file.name}")
+            self._print_detail(f"   📁 Enterprise processing: {php_file.name}")
+
+            # Đọc file một lần - backup, phân tích và conversion dùng chung nội dung này
+            content_bytes = self.read_php_bytes(php_file)
 
-            # Bước 1: Tạo backup
-            backup_success = self.backup_file(php_file)
-            conversion_info['backup_created'] = backup_success
+            # Bước 1: Tạo backup - được hoãn lại khi file gốc bị xóa, xem run_enterprise
+            if not self.defer_backups:
+                backup_success = self.backup_file(php_file, content_bytes)
+                conversion_info['backup_created'] = backup_success
 
-            if not backup_success:
-                return False, "Tạo backup thất bại - hủy bỏ để đảm bảo an toàn", conversion_info
+                if not backup_success:
+                    return False, "Tạo backup thất bại - hủy bỏ để đảm bảo an toàn", conversion_info
 
             # Bước 2: Phân tích file
-            analysis = self.analyze_php_file(php_file)
+            try:
+                # Universal newlines, giống như open() ở text mode
+                content = str(content_bytes, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            except UnicodeDecodeError as e:
+                return False, f"Phân tích file thất bại: {e}", conversion_info
+
+            analysis = self.analyze_php_file(php_file, content, content_bytes)
             conversion_info['analysis'] = analysis
 
             if 'error' in analysis:
                 return False, f"Phân tích file thất bại: {analysis['error']}", conversion_info
 
-            print(f"      📏 Kích thước: {analysis['file_size']} bytes, Dòng: {analysis['line_count']}")
+            self._print_detail(f"      📏 Kích thước: {analysis['file_size']} bytes, Dòng: {analysis['line_count']}")
             if analysis['variable_names']:
-                print(f"      🔤 Biến: {', '.join(analysis['variable_names'][:3])}{'...' if len(analysis['variable_names']) > 3 else ''}")
+                self._print_detail(f"      🔤 Biến: {', '.join(analysis['variable_names'][:3])}{'...' if len(analysis['variable_names']) > 3 else ''}")
 
-            # Bước 3: Convert với auto-retry
-            success, message, data, retry_info = self.auto_retry_conversion(php_file, self.max_retries)
-            conversion_info['retry_attempts'] = retry_info.get('attempts', 0)
+            # Bước 3: Parse và validate, trừ khi nội dung giống hệt đã được convert và verify
+            data = self.load_cached_parse(analysis['content_hash'])
+            cache_hit = data is not None
+
+            if cache_hit:
+                self._print_detail(f"      ⚡ Parse cache hit - dùng lại kết quả đã verify")
+            else:
+                success, message, data = self.parse_and_validate(php_file, content)
 
-            if not success:
-                return False, message, conversion_info
+                if not success:
+                    return False, message, conversion_info
 
             # Bước 4: Validate JSON output
             is_valid, validation_msg = self.validate_json_output(data)
@@ -751,17 +1316,25 @@ class EnterprisePHPToJSONConverter:
             if not is_valid:
                 return False, f"Validation thất bại: {validation_msg}", conversion_info
 
-            print(f"      ✅ Conversion thành công: {validation_msg}")
+            self._print_detail(f"      ✅ Conversion thành công: {validation_msg}")
 
-            # Bước 5: Lưu JSON file
+            # Bước 5: Encode một lần và lưu JSON file; payload được tái sử dụng cho verification
             json_file = php_file.with_suffix('.json')
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            payload = self.encode_json_output(data)
+            # Ghi rồi rename, để lần chạy bị gián đoạn không bao giờ để lại JSON file bị cắt cụt cạnh file PHP
+            tmp_file = json_file.with_name(f"{json_file.name}.{os.getpid()}.tmp")
+            try:
+                self.write_file_bytes(tmp_file, payload)
+                os.replace(tmp_file, json_file)
+            except OSError:
+                if tmp_file.exists():
+                    tmp_file.unlink()
+                raise
 
             # Bước 6: Enterprise data integrity verification
             if self.integrity_check_enabled:
                 integrity_passed, integrity_msg, integrity_report = self.verify_data_integrity(
-                    php_file, json_file, data
+                    php_file, json_file, data, payload
                 )
                 conversion_info['integrity'] = integrity_report
 
@@ -771,7 +1344,9 @@ class EnterprisePHPToJSONConverter:
                         json_file.unlink()
                     return False, f"Kiểm tra tính toàn vẹn thất bại: {integrity_msg}", conversion_info
 
-                self.verified_files.append(php_file)
+            # Ghi nhớ output đã verify để nội dung không đổi bỏ qua parsing ở các lần chạy sau
+            if not cache_hit:
+                self.store_cached_parse(analysis['content_hash'], payload)
 
             self.log_to_file(self.conversion_log, "SUCCESS", f"Enterprise conversion completed: {php_file}")
             return True, f"{validation_msg} + tính toàn vẹn đã xác minh", conversion_info
@@ -779,6 +1354,9 @@ class EnterprisePHPToJSONConverter:
         except Exception as e:
             self.log_to_file(self.conversion_log, "ERROR", f"Enterprise conversion error for {php_file}: {e}")
             return False, f"Lỗi enterprise conversion: {str(e)}", conversion_info
+        finally:
+            # Một lần ghi log theo lô cho mỗi file; worker của pool thoát mà không chạy atexit flush của logging
+            self.flush_logs()
 
     def safe_delete_php_file(self, php_file: Path) -> bool:
         """Xóa PHP file an toàn với nhiều lần xác nhận"""
@@ -787,15 +1365,21 @@ class EnterprisePHPToJSONConverter:
             json_file = php_file.with_suffix('.json')
 
             if not json_file.exists():
-                print(f"      ❌ JSON file thiếu, không thể xóa {php_file.name}")
+                self._print_detail(f"      ❌ JSON file thiếu, không thể xóa {php_file.name}")
                 return False
 
             # Đọc và verify JSON file một lần nữa
-            with open(json_file, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            with open(json_file, 'rb') as f:
+                json_data = self.decode_json_bytes(f.read())
 
             if not json_data or len(json_data) == 0:
-                print(f"      ❌ JSON file rỗng, không thể xóa {php_file.name}")
+                self._print_detail(f"      ❌ JSON file rỗng, không thể xóa {php_file.name}")
+                return False
+
+            # Backup ngay trước khi xóa, bằng hardlink, để chỉ những file thực sự bị xóa mới dùng
+            # chung inode với backup
+            if not self.backup_file(php_file, link=True):
+                self._print_detail(f"      ❌ Backup thất bại, không thể xóa {php_file.name}")
                 return False
 
             # Xóa an toàn
@@ -819,10 +1403,14 @@ class EnterprisePHPToJSONConverter:
             return
 
         print(f"\n🎯 Tính năng Enterprise Processing:")
+        if self.php_bin:
+            print(f"   • Đánh giá PHP gốc qua {self.php_bin}")
         print(f"   • Hệ thống backup tự động")
         print(f"   • Data integrity verification")
-        print(f"   • Auto-retry với {self.max_retries} lần thử")
-        print(f"   • Deep comparison PHP ↔ JSON")
+        if self.jobs > 1:
+            print(f"   • Xử lý song song với {self.jobs} worker processes")
+        if self.full_verification:
+            print(f"   • Deep comparison PHP ↔ JSON")
         print(f"   • Enterprise logging và audit trails")
         print(f"   • Safe deletion với nhiều lần xác nhận")
 
@@ -838,48 +1426,100 @@ class EnterprisePHPToJSONConverter:
                 confirm2 = input("🛡️  Xác nhận cuối: Xóa file PHP sau 100% integrity verification? (y/N): ").strip().lower()
                 delete_php = confirm2 in ['y', 'yes']
 
+        # Khi file gốc bị xóa, backup được tạo khi đã biết kết quả của từng file: file convert thành
+        # công được safe_delete_php_file hardlink ngay trước khi xóa, file thất bại được copy tại đây
+        self.defer_backups = delete_php
         print(f"\n🔄 Bắt đầu enterprise conversion {count} files...")
         print("=" * 75)
 
-        failed_details = []
+        error_summary = Counter()
         integrity_failures = []
 
-        for i, php_file in enumerate(self.php_files, 1):
-            print(f"\n📊 [{i}/{count}] {php_file.relative_to(self.root_dir)}")
-
-            success, message, info = self.convert_file_enterprise(php_file)
-
-            if success:
-                self.converted_count += 1
-                print(f"   ✅ {php_file.name} -> {php_file.stem}.json ({message})")
-
-                if delete_php:
-                    if self.safe_delete_php_file(php_file):
-                        self.deleted_count += 1
-                        print(f"   🗑️  Đã xóa an toàn {php_file.name}")
-                    else:
-                        print(f"   ⚠️  Không thể xóa an toàn {php_file.name}")
+        if not self.backup_dir:
+            self.create_backup_system()
+
+        # Xếp hàng readahead cho tất cả file để đọc đĩa chồng lấp với parsing
+        self.prefetch_php_files()
+
+        executor = None
+        if self.jobs > 1 and count > 1:
+            # Phân phối file cho worker processes; kết quả được thu thập theo thứ tự ở process cha
+            # Flush các record đang buffer ở process cha trước - worker được fork sẽ kế thừa và ghi lại chúng
+            self.flush_logs()
+            workers = min(self.jobs, count)
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,))
+            results = executor.map(_convert_one, self.php_files, chunksize=max(1, count // (workers * 4)))
+        else:
+            results = map(self.convert_file_enterprise, self.php_files)
+
+        # Việc xóa chạy trên một background thread để vòng lặp chuyển sang kết quả tiếp theo;
+        # kết quả xóa được báo cáo sau khi thread xử lý xong
+        deleter = ThreadPoolExecutor(max_workers=1) if delete_php else None
+        deletions = []
+
+        # Các dòng trạng thái được buffer và ghi theo lô; chế độ verbose flush mỗi file để
+        # khớp thứ tự với output chi tiết
+        status_lines = []
+        try:
+            for i, (php_file, (success, message, info)) in enumerate(zip(self.php_files, results), 1):
+                name = php_file.name
+                status_lines.append(f"\n📊 [{i}/{count}] {php_file.relative_to(self.root_dir)}\n")
+
+                if success:
+                    self.converted_count += 1
+                    if info.get('integrity', {}).get('data_match', False):
+                        self.verified_files.append(php_file)
+                    status_lines.append(f"   ✅ {name} -> {name[:-4]}.json ({message})\n")
+
+                    if delete_php:
+                        deletions.append((php_file, deleter.submit(self.safe_delete_php_file, php_file)))
+                else:
+                    self.failed_count += 1
+                    self.failed_files.append(php_file)
+                    if self.defer_backups:
+                        self.backup_file(php_file)
+
+                    # Kiểm tra nếu là integrity failure
+                    if 'integrity' in info and not info['integrity'].get('data_match', False):
+                        integrity_failures.append(php_file)
+
+                    # Chỉ loại lỗi được báo cáo, nên info dict của file lỗi không được giữ lại
+                    error_summary[message.partition(':')[0]] += 1
+                    status_lines.append(f"   ❌ {name}: {message}\n")
+
+                if self.verbose or i % self._STATUS_FLUSH_INTERVAL == 0:
+                    sys.stdout.write(''.join(status_lines))
+                    status_lines.clear()
+
+                if executor is None and self.processing_delay > 0:
+                    time.sleep(self.processing_delay)
+        finally:
+            if status_lines:
+                sys.stdout.write(''.join(status_lines))
+                status_lines.clear()
+            if executor is not None:
+                executor.shutdown()
+            if deleter is not None:
+                deleter.shutdown()
+
+        for php_file, deletion in deletions:
+            if deletion.result():
+                self.deleted_count += 1
+                status_lines.append(f"   🗑️  Đã xóa an toàn {php_file.name}\n")
             else:
-                self.failed_count += 1
-                self.failed_files.append(php_file)
+                status_lines.append(f"   ⚠️  Không thể xóa an toàn {php_file.name}\n")
+        if deletions:
+            sys.stdout.write('\n' + ''.join(status_lines))
 
-                # Kiểm tra nếu là integrity failure
-                if 'integrity' in info and not info['integrity'].get('data_match', False):
-                    integrity_failures.append(php_file)
+        self.flush_logs()
+        self._print_enterprise_results(error_summary, integrity_failures)
 
-                failed_details.append({
-                    'file': php_file.name,
-                    'error': message,
-                    'info': info
-                })
-                print(f"   ❌ {php_file.name}: {message}")
+        # Hiển thị credit banner đẹp sau kết quả - chỉ trên terminal tương tác, để output bị
+        # redirect và log CI không có banner
+        if sys.stdout.isatty():
+            self._show_credit_banner()
 
-            if self.processing_delay > 0:
-                time.sleep(self.processing_delay)
-
-        self._print_enterprise_results(failed_details, integrity_failures)
-
-    def _print_enterprise_results(self, failed_details: List[Dict], integrity_failures: List[Path]):
+    def _print_enterprise_results(self, error_summary: Counter, integrity_failures: List[Path]):
         """In kết quả enterprise toàn diện"""
         print(f"\n" + "=" * 75)
         print(f"🏢 KẾT QUẢ ENTERPRISE CONVERSION:")
@@ -894,14 +1534,9 @@ class EnterprisePHPToJSONConverter:
         if self.backup_dir:
             print(f"   🛡️  Thư mục backup: {self.backup_dir.name}")
 
-        if failed_details:
+        if error_summary:
             print(f"\n❌ PHÂN TÍCH THẤT BẠI:")
-            error_summary = {}
-            for detail in failed_details:
-                error_type = detail['error'].split(':')[0]
-                error_summary[error_type] = error_summary.get(error_type, 0) + 1
-
-            for error_type, count in error_summary.items():
+            for error_type, count in error_summary.most_common():
                 print(f"   • {error_type}: {count} files")
 
         success_rate = (self.converted_count / len(self.php_files)) * 100 if self.php_files else 0
@@ -919,45 +1554,52 @@ class EnterprisePHPToJSONConverter:
             print(f"   • Thư mục backup chứa file gốc để recovery")
             print(f"   • Cân nhắc review thủ công các cấu trúc PHP phức tạp")
 
-        # Hiển thị credit banner đẹp sau kết quả
-        self._show_credit_banner()
-
     def _show_credit_banner(self):
         """Hiển thị credit banner đẹp với thông tin liên hệ"""
-        print(f"\n" + "═" * 75)
-        print("╔" + "═" * 73 + "╗")
-        print("║" + " " * 73 + "║")
-        print("║" + "   ██████╗ ██╗  ██╗██████╗ ██████╗      ██╗███████╗ ██████╗ ███╗   ██╗".center(73) + "║")
-        print("║" + "   ██╔══██╗██║  ██║██╔══██╗╚════██╗     ██║██╔════╝██╔═══██╗████╗  ██║".center(73) + "║")
-        print("║" + "   ██████╔╝███████║██████╔╝ █████╔╝     ██║███████╗██║   ██║██╔██╗ ██║".center(73) + "║")
-        print("║" + "   ██╔═══╝ ██╔══██║██╔═══╝ ██╔═══╝ ██   ██║╚════██║██║   ██║██║╚██╗██║".center(73) + "║")
-        print("║" + "   ██║     ██║  ██║██║     ███████╗╚█████╔╝███████║╚██████╔╝██║ ╚████║".center(73) + "║")
-        print("║" + "   ╚═╝     ╚═╝  ╚═╝╚═╝     ╚══════╝ ╚════╝ ╚══════╝ ╚═════╝ ╚═╝  ╚═══╝".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "🚀 ENTERPRISE PHP TO JSON LANGUAGE CONVERTER 🚀".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "🎯 TẠO BỞI: KÊNH TÁO".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "📱 TELEGRAM: @QTUNUy".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "🌐 WEBSITES:".center(73) + "║")
-        print("║" + "• CertApple.com  • Kenhtao.net  • kenhtao.site  • iPA.KenhTao.net".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "💝 Cảm ơn bạn đã sử dụng PHP2JSON Enterprise Converter! 💝".center(73) + "║")
-        print("║" + "⭐ Nếu tool này hữu ích, hãy star GitHub repository của chúng tôi ⭐".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("║" + "🔔 Để nhận updates và support, hãy follow Telegram: @QTUNUy 🔔".center(73) + "║")
-        print("║" + " " * 73 + "║")
-        print("╚" + "═" * 73 + "╝")
-        print("═" * 75)
+        sys.stdout.write(_CREDIT_BANNER)
+
+# Process pool workers - mỗi worker process nhận một bản sao converter riêng một lần duy nhất
+_worker_converter = None
+
+def _init_worker(converter):
+    """Lưu converter vào global state của worker process"""
+    global _worker_converter
+    _worker_converter = converter
+
+def _convert_one(php_file):
+    """Chuyển đổi một file bên trong worker process"""
+    return _worker_converter.convert_file_enterprise(php_file)
 
 def main():
+    parser = argparse.ArgumentParser(description="Enterprise converter file ngôn ngữ PHP sang JSON")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="số lượng worker processes (mặc định: số CPU, 1 = tuần tự)")
+    parser.add_argument('--delay', type=float, default=0.0, metavar='SECONDS',
+                        help="tạm dừng số giây này giữa các file ở chế độ tuần tự (mặc định: 0)")
+    parser.add_argument('--php', action='store_true',
+                        help="đánh giá file bằng PHP CLI khi có php trong PATH - việc này thực thi code của từng file")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="không đọc hoặc ghi parse cache (.converter_cache/)")
+    parser.add_argument('--compact', action='store_true',
+                        help="ghi JSON thu gọn (không indent) để file nhỏ hơn và encode nhanh hơn")
+    parser.add_argument('--full-verify', action='store_true',
+                        help="luôn parse lại từng file JSON đã ghi và so sánh sâu với dữ liệu đã parse")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="hiển thị chi tiết parsing và verification cho từng file")
+    args = parser.parse_args()
+
     try:
         converter = EnterprisePHPToJSONConverter()
+        converter.jobs = max(1, args.jobs)
+        converter.processing_delay = max(0.0, args.delay)
+        converter.parse_cache_enabled = not args.no_cache
+        if args.php:
+            converter.php_bin = shutil.which("php")
+            if not converter.php_bin:
+                print("⚠️ Có --php nhưng không tìm thấy php trong PATH - dùng parser có sẵn")
+        converter.verbose = args.verbose
+        converter.compact_output = args.compact
+        converter.full_verification = args.full_verify
         converter.run_enterprise()
     except KeyboardInterrupt:
         print("\n⚠️ Enterprise conversion bị dừng lại bởi user")